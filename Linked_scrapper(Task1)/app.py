@@ -3,10 +3,17 @@ import pandas as pd
 import time
 from datetime import datetime
 import io
-import sys
-from linkedin_scraper import LinkedInScraper
-import logging
-from io import StringIO
+from session_store import SessionStore
+from result_cache import ResultCache
+from profile_urls import iter_profile_urls
+from scrape_jobs import JobManager
+from rate_controller import RateController
+from results_store import ResultsStore
+from profile_fields import PROFILE_FIELDNAMES, PROFILE_FIELDS
+from exporters import EXPORT_FORMATS, ExportCache
+from log_pipeline import configure_logging
+from change_tracker import ChangeTracker, change_fieldnames
+from driver_manager import WarmDriverPool
 
 st.set_page_config(
     page_title="LinkedIn Profile Scraper",
@@ -57,20 +64,73 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
-if 'scraping' not in st.session_state:
-    st.session_state.scraping = False
-if 'results' not in st.session_state:
-    st.session_state.results = None
-if 'logs' not in st.session_state:
-    st.session_state.logs = []
+RESULTS_PAGE_SIZE = 100
 
-class StreamlitLogHandler(logging.Handler):
-    def __init__(self):
-        super().__init__()
 
-    def emit(self, record):
-        log_entry = self.format(record)
-        st.session_state.logs.append(log_entry)
+@st.cache_resource
+def start_logging():
+    # Once per server process; job log views attach to this pipeline
+    return configure_logging()
+
+
+@st.cache_resource
+def get_results_store():
+    return ResultsStore()
+
+
+@st.cache_resource
+def get_job_manager():
+    return JobManager(results_store=get_results_store())
+
+
+@st.cache_resource
+def get_export_cache():
+    return ExportCache()
+
+
+def launch_warm_browser(lightweight):
+    from linkedin_scraper import prewarm_browser
+    return prewarm_browser(lightweight=lightweight)
+
+
+@st.cache_resource
+def get_browser_pool():
+    # Chrome launches and opens the login page while the user is still
+    # filling in the form; the next job takes it over. One warm browser for
+    # the whole server, quit after five minutes nobody has touched it.
+    return WarmDriverPool(launch_warm_browser, max_size=1, idle_seconds=300)
+
+
+@st.cache_resource
+def get_result_cache(ttl_hours):
+    # One connection per TTL setting for the whole server instead of one per job
+    return ResultCache(ttl=ttl_hours * 3600)
+
+
+@st.cache_resource
+def get_change_tracker():
+    # One fingerprint history shared by every run on this server
+    return ChangeTracker()
+
+
+start_logging()
+results_store = get_results_store()
+export_cache = get_export_cache()
+job_manager = get_job_manager()
+
+if 'job_id' not in st.session_state:
+    # Reattach to a running job after a browser refresh
+    st.session_state.job_id = st.experimental_get_query_params().get('job', [None])[0]
+if 'loaded_job_id' not in st.session_state:
+    st.session_state.loaded_job_id = None
+if 'results_job_id' not in st.session_state:
+    # Results live in the results store, so a finished job's id is enough
+    # to show them again in a new session
+    st.session_state.results_job_id = st.session_state.job_id
+if 'cache_stats' not in st.session_state:
+    st.session_state.cache_stats = None
+
+active_job = job_manager.get(st.session_state.job_id) if st.session_state.job_id else None
 
 st.title("🔍 LinkedIn Profile Scraper")
 st.markdown("### Extract profile data from LinkedIn with ease")
@@ -85,6 +145,48 @@ with st.sidebar:
 
     st.markdown("---")
 
+    st.markdown("### 🌐 Browser")
+    lightweight = st.checkbox(
+        "Headless lightweight mode",
+        value=False,
+        help="Run Chrome headless and block images, fonts, media and trackers to save bandwidth and memory"
+    )
+    fast_path = st.checkbox(
+        "HTTP fast path",
+        value=False,
+        help="Fetch each profile over plain HTTP with the logged-in cookies and only open it in Chrome when fields are missing"
+    )
+    recycle_after_pages = st.number_input(
+        "Restart browser after (profiles)",
+        min_value=0,
+        value=200,
+        help="Swap in a fresh, pre-warmed Chrome after this many profiles to keep memory flat. 0 disables it."
+    )
+    browser_count = st.number_input(
+        "Parallel browsers",
+        min_value=1,
+        max_value=4,
+        value=1,
+        help="Browser sessions driven side by side from one event loop; they all share the account's pace"
+    )
+
+    st.markdown("### 🗄️ Cache")
+    cache_ttl_hours = st.number_input(
+        "Reuse results newer than (hours)",
+        min_value=0,
+        value=24,
+        help="Profiles scraped within this window are served from the local cache"
+    )
+    force_refresh = st.checkbox("Force refresh (ignore cache)", value=False)
+    track_changes = st.checkbox(
+        "Report changes since last run",
+        value=False,
+        help="Lists new, changed and disappeared profiles separately. "
+             "Combine with force refresh so cached results aren't compared with themselves."
+    )
+
+    st.markdown("---")
+
     st.markdown("### ℹ️ About")
     st.info("""
     **Features:**
@@ -101,13 +203,65 @@ with st.sidebar:
 
     st.markdown("---")
     st.markdown("### 📊 Stats")
-    if st.session_state.results:
-        df = st.session_state.results
-        success_count = len(df[df['status'] == 'success'])
-        total_count = len(df)
-        st.metric("Success Rate", f"{(success_count/total_count)*100:.1f}%")
-        st.metric("Total Profiles", total_count)
-        st.metric("Successful", success_count)
+    if st.session_state.results_job_id:
+        status_counts = results_store.status_counts(st.session_state.results_job_id)
+        total_count = sum(status_counts.values())
+        if total_count:
+            success_count = status_counts.get('success', 0)
+            st.metric("Success Rate", f"{(success_count/total_count)*100:.1f}%")
+            st.metric("Total Profiles", total_count)
+            st.metric("Successful", success_count)
+    if st.session_state.cache_stats:
+        st.metric("Cache Hits", st.session_state.cache_stats['cache_hits'])
+        st.metric("Fresh Scrapes", st.session_state.cache_stats['fresh_scrapes'])
+
+    if active_job:
+        metrics_summary = active_job.metrics.summary()
+        if metrics_summary['phases']:
+            st.markdown("### ⏱️ Time per Phase")
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        'phase': phase,
+                        'count': timing['count'],
+                        'mean (s)': timing['mean_seconds'],
+                        'p95 (s)': timing['p95_seconds'],
+                        'total (s)': timing['total_seconds'],
+                    }
+                    for phase, timing in metrics_summary['phases'].items()
+                ]),
+                hide_index=True,
+                use_container_width=True
+            )
+            missing = {
+                name[len('missing_field{field='):-1]: value
+                for name, value in metrics_summary['counters'].items()
+                if name.startswith('missing_field')
+            }
+            if missing:
+                st.caption("Missing fields: " + ", ".join(f"{field} ×{value}" for field, value in missing.items()))
+
+    previous_runs = results_store.recent_jobs()
+    if previous_runs:
+        st.markdown("---")
+        st.markdown("### 📂 Previous Runs")
+        run_labels = {
+            run['job_id']: f"{datetime.fromtimestamp(run['scraped_at']).strftime('%Y-%m-%d %H:%M')} ({run['count']} profiles)"
+            for run in previous_runs
+        }
+        run_ids = list(run_labels)
+        selected_run = st.selectbox(
+            "Open results of",
+            options=run_ids,
+            index=run_ids.index(st.session_state.results_job_id) if st.session_state.results_job_id in run_labels else 0,
+            format_func=run_labels.get
+        )
+        if st.button("Open", use_container_width=True) and selected_run != st.session_state.results_job_id:
+            st.session_state.results_job_id = selected_run
+            st.rerun()
+
+if email and not (active_job and active_job.running):
+    get_browser_pool().warm(lightweight)
 
 col1, col2 = st.columns([2, 1])
 
@@ -121,6 +275,7 @@ with col1:
     )
 
     profile_urls = []
+    url_stats = {}
 
     if input_method == "📄 Upload File":
         uploaded_file = st.file_uploader(
@@ -130,9 +285,9 @@ with col1:
         )
 
         if uploaded_file:
-            content = uploaded_file.read().decode('utf-8')
-            profile_urls = [line.strip() for line in content.split('\n') if line.strip()]
-            st.success(f"✅ Loaded {len(profile_urls)} URLs from file")
+            lines = io.TextIOWrapper(uploaded_file, encoding='utf-8', errors='ignore')
+            profile_urls = list(iter_profile_urls(lines, url_stats))
+            st.success(f"✅ Loaded {len(profile_urls)} unique profile URLs from file")
 
             with st.expander("📋 Preview URLs"):
                 for idx, url in enumerate(profile_urls[:10], 1):
@@ -148,8 +303,22 @@ with col1:
         )
 
         if urls_text:
-            profile_urls = [line.strip() for line in urls_text.split('\n') if line.strip()]
-            st.success(f"✅ Found {len(profile_urls)} URLs")
+            profile_urls = list(iter_profile_urls(urls_text.splitlines(), url_stats))
+            st.success(f"✅ Found {len(profile_urls)} unique profile URLs")
+
+    if url_stats.get('duplicates') or url_stats.get('rejected'):
+        st.caption(
+            f"Dropped {url_stats['duplicates']} duplicate(s) and "
+            f"{url_stats['rejected']} line(s) that are not LinkedIn profile URLs"
+        )
+
+    selected_fields = st.multiselect(
+        "Fields to collect",
+        options=list(PROFILE_FIELDS),
+        default=list(PROFILE_FIELDS),
+        format_func=str.capitalize,
+        help="Leaving out About skips the scrolling and lazy-load wait on every profile"
+    )
 
 with col2:
     st.markdown("## 🎯 Quick Actions")
@@ -165,9 +334,11 @@ https://www.linkedin.com/in/reed-hastings-10a77b/"""
 
     st.markdown("---")
 
-    if st.button("🗑️ Clear All", use_container_width=True):
-        st.session_state.results = None
-        st.session_state.logs = []
+    if st.button("🗑️ Clear All", use_container_width=True, disabled=bool(active_job and active_job.running)):
+        st.session_state.results_job_id = None
+        st.session_state.cache_stats = None
+        st.session_state.job_id = None
+        st.experimental_set_query_params()
         st.rerun()
 
 st.markdown("---")
@@ -179,135 +350,161 @@ if profile_urls:
     with col1:
         st.metric("URLs to Scrape", len(profile_urls))
     with col2:
-        estimated_time = len(profile_urls) * 45
-        st.metric("Estimated Time", f"{estimated_time//60} min {estimated_time%60} sec")
+        starting_pace = RateController()
+        estimated_time = int(starting_pace.eta(len(profile_urls)))
+        st.metric(
+            "Estimated Time",
+            f"{estimated_time//60} min {estimated_time%60} sec",
+            help=f"At the starting pace of {starting_pace.per_minute} profiles/min; "
+                 "the pace adapts once scraping starts and cached profiles are near-instant"
+        )
     with col3:
         st.metric("Status", "Ready ✅")
 
     st.markdown("---")
 
-    if st.button("🎬 Start Scraping", type="primary", use_container_width=True, disabled=st.session_state.scraping):
+    scraping = bool(active_job and active_job.running)
+    if st.button("🎬 Start Scraping", type="primary", use_container_width=True, disabled=scraping):
 
         if not email or not password:
             st.error("⚠️ Please enter your LinkedIn credentials in the sidebar!")
+        elif not selected_fields:
+            st.error("⚠️ Please select at least one field to collect!")
         else:
-            st.session_state.scraping = True
-            st.session_state.logs = []
-
-            log_handler = StreamlitLogHandler()
-            log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-            logger = logging.getLogger()
-            logger.addHandler(log_handler)
-            logger.setLevel(logging.INFO)
-
-            progress_container = st.container()
-            log_container = st.container()
-
-            with progress_container:
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                current_profile = st.empty()
-
-            with log_container:
-                st.markdown("### 📊 Live Logs")
-                log_display = st.empty()
-
-            try:
-                status_text.text("🔧 Initializing scraper...")
-                scraper = LinkedInScraper(email, password)
-
-                status_text.text("🌐 Setting up browser...")
-                scraper.setup_driver()
-
-                status_text.text("🔐 Logging in to LinkedIn...")
-                if not scraper.login():
-                    st.error("❌ Login failed! Please check your credentials.")
-                    st.session_state.scraping = False
-                    st.stop()
-
-                st.success("✅ Login successful!")
-
-                results = []
-                total = len(profile_urls)
-
-                for idx, url in enumerate(profile_urls):
-                    progress = (idx + 1) / total
-                    progress_bar.progress(progress)
-                    status_text.text(f"📍 Scraping profile {idx + 1} of {total}")
-                    current_profile.markdown(f"**Current:** {url}")
-
-                    if st.session_state.logs:
-                        log_html = "<div class='log-container'>"
-                        for log in st.session_state.logs[-20:]:
-                            log_html += f"<div>{log}</div>"
-                        log_html += "</div>"
-                        log_display.markdown(log_html, unsafe_allow_html=True)
-
-                    if idx > 0:
-                        time.sleep(5)
-
-                    profile_data = scraper.extract_profile_data(url)
-                    results.append(profile_data)
-
-                scraper.close()
-
-                df = pd.DataFrame(results)
-                st.session_state.results = df
-                st.session_state.scraping = False
-
-                progress_bar.progress(1.0)
-                status_text.text("✅ Scraping completed!")
+            active_job = job_manager.submit(
+                email,
+                password,
+                profile_urls,
+                workers=browser_count,
+                scraper_options={
+                    'lightweight': lightweight,
+                    'session_store': SessionStore(),
+                    'result_cache': get_result_cache(cache_ttl_hours),
+                    'force_refresh': force_refresh,
+                    'fast_path': fast_path,
+                    'recycle_after_pages': recycle_after_pages or None,
+                    'max_driver_rss_mb': 1500,
+                    'prewarm_drivers': 1 if recycle_after_pages else 0,
+                    'fields': selected_fields,
+                    'change_tracker': get_change_tracker() if track_changes else None,
+                    'driver_manager': get_browser_pool().take(lightweight),
+                }
+            )
+            st.session_state.job_id = active_job.id
+            st.session_state.results_job_id = None
+            st.experimental_set_query_params(job=active_job.id)
+            st.rerun()
+
+if active_job:
+    job = active_job.snapshot()
+
+    if active_job.running:
+        st.markdown("## ⏳ Scraping in Progress")
+
+        progress = job['completed'] / job['total'] if job['total'] else 0
+        st.progress(progress)
+        st.text(f"📍 {job['message']}")
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Throughput", f"{job['throughput_per_minute']:.1f} / min")
+        with col2:
+            if job['target_per_minute'] is not None:
+                st.metric("Allowed Pace", f"{job['target_per_minute']:.1f} / min")
+        with col3:
+            eta = job['eta_seconds']
+            st.metric("Time Remaining", f"{int(eta)//60} min {int(eta)%60} sec" if eta is not None else "—")
+        if job['current_url']:
+            st.markdown(f"**Last completed:** {job['current_url']}")
+
+        if st.button("⏹️ Stop Scraping"):
+            active_job.cancel()
+
+        st.markdown("### 📊 Live Logs")
+        logs = active_job.recent_logs(20)
+        if logs:
+            log_html = "<div class='log-container'>"
+            for log in logs:
+                log_html += f"<div>{log}</div>"
+            log_html += "</div>"
+            st.markdown(log_html, unsafe_allow_html=True)
+
+        # The scrape runs in the job's own thread; this script run only
+        # polls it, so a short sleep between refreshes is all that blocks
+        time.sleep(1)
+        st.rerun()
 
-                st.success(f"🎉 Successfully scraped {len(results)} profiles!")
+    elif st.session_state.loaded_job_id != active_job.id:
+        st.session_state.loaded_job_id = active_job.id
+        st.session_state.cache_stats = {
+            'cache_hits': job['cache_hits'],
+            'fresh_scrapes': job['fresh_scrapes']
+        }
+
+        if job['state'] == 'failed':
+            st.error(f"❌ Error: {job['error']}")
+
+        if active_job.results:
+            st.session_state.results_job_id = active_job.id
+            st.success(f"🎉 Successfully scraped {len(active_job.results)} profiles!")
+            st.info(f"🗄️ {job['cache_hits']} served from cache, {job['fresh_scrapes']} freshly scraped")
+            if job['state'] == 'completed':
                 st.balloons()
 
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
-                st.session_state.scraping = False
-                if 'scraper' in locals():
-                    scraper.close()
-
-if st.session_state.results is not None:
+if st.session_state.results_job_id and results_store.count(st.session_state.results_job_id):
     st.markdown("---")
     st.markdown("## 📊 Results")
 
-    df = st.session_state.results
+    results_job_id = st.session_state.results_job_id
+    results_job = job_manager.get(results_job_id)
+    # Runs from before a restart don't remember their field selection
+    result_columns = results_job.fieldnames if results_job else PROFILE_FIELDNAMES
+    status_counts = results_store.status_counts(results_job_id)
+    total_count = sum(status_counts.values())
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Profiles", len(df))
+        st.metric("Total Profiles", total_count)
     with col2:
-        success_count = len(df[df['status'] == 'success'])
-        st.metric("Successful", success_count, delta=f"{(success_count/len(df))*100:.1f}%")
+        success_count = status_counts.get('success', 0)
+        st.metric("Successful", success_count, delta=f"{(success_count/total_count)*100:.1f}%")
     with col3:
-        failed_count = len(df[df['status'] != 'success'])
+        failed_count = total_count - success_count
         st.metric("Failed", failed_count)
     with col4:
-        with_name = len(df[df['name'] != ''])
+        with_name = results_store.named_count(results_job_id)
         st.metric("With Name", with_name)
 
     st.markdown("---")
 
     st.markdown("### 📋 Scraped Data")
 
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns([2, 2, 1])
     with col1:
         status_filter = st.multiselect(
             "Filter by Status",
-            options=df['status'].unique(),
-            default=df['status'].unique()
+            options=list(status_counts),
+            default=list(status_counts)
         )
     with col2:
-        search_term = st.text_input("🔍 Search in results", "")
+        search_term = st.text_input("🔍 Search name, headline, location or about", "")
 
-    filtered_df = df[df['status'].isin(status_filter)]
-    if search_term:
-        filtered_df = filtered_df[
-            filtered_df.apply(lambda row: search_term.lower() in str(row).lower(), axis=1)
-        ]
+    filtered_count = results_store.count(results_job_id, status_filter, search_term)
+    page_count = max(1, -(-filtered_count // RESULTS_PAGE_SIZE))
+    with col3:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+
+    page_rows = results_store.query(
+        results_job_id,
+        status_filter,
+        search_term,
+        limit=RESULTS_PAGE_SIZE,
+        offset=(page - 1) * RESULTS_PAGE_SIZE
+    )
+    st.caption(f"{filtered_count} matching profiles · page {page} of {page_count}")
 
     st.dataframe(
-        filtered_df,
+        pd.DataFrame(page_rows, columns=result_columns),
         use_container_width=True,
         height=400
     )
@@ -316,30 +513,70 @@ if st.session_state.results is not None:
 
     st.markdown("### 💾 Download Results")
 
-    col1, col2 = st.columns(2)
+    # Artifacts are only built when asked for and are cached by the result
+    # set's fingerprint, so reruns (e.g. typing in the search box) cost nothing
+    result_key = results_store.fingerprint(results_job_id)
 
+    col1, col2 = st.columns(2)
     with col1:
-        csv = df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download as CSV",
-            data=csv,
-            file_name=f"linkedin_profiles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv",
-            use_container_width=True
+        export_format = st.selectbox(
+            "Format",
+            options=list(EXPORT_FORMATS),
+            format_func=lambda fmt: EXPORT_FORMATS[fmt]['label']
         )
 
+    export_path = export_cache.get(result_key, export_format, result_columns)
     with col2:
-        buffer = io.BytesIO()
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='LinkedIn Profiles')
-
-        st.download_button(
-            label="📥 Download as Excel",
-            data=buffer.getvalue(),
-            file_name=f"linkedin_profiles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            use_container_width=True
-        )
+        st.markdown("<div style='height: 28px'></div>", unsafe_allow_html=True)
+        if export_path is None:
+            if st.button(f"⚙️ Prepare {EXPORT_FORMATS[export_format]['label']} file", use_container_width=True):
+                with st.spinner("Preparing export..."):
+                    try:
+                        export_cache.create(
+                            result_key,
+                            export_format,
+                            results_store.iter_rows(results_job_id),
+                            result_columns
+                        )
+                    except Exception as e:
+                        st.error(f"❌ Export failed: {str(e)}")
+                    else:
+                        st.rerun()
+        else:
+            with open(export_path, 'rb') as export_file:
+                st.download_button(
+                    label=f"📥 Download as {EXPORT_FORMATS[export_format]['label']}",
+                    data=export_file,
+                    file_name=f"linkedin_profiles_{datetime.now().strftime('%Y%m%d_%H%M%S')}{EXPORT_FORMATS[export_format]['extension']}",
+                    mime=EXPORT_FORMATS[export_format]['mime'],
+                    use_container_width=True
+                )
+
+    if results_job and results_job.changes is not None:
+        st.markdown("---")
+        st.markdown("### 🔄 Changes Since Last Run")
+
+        changes_df = pd.DataFrame(results_job.changes, columns=change_fieldnames(results_job.scraper_options.get('fields')))
+        change_counts = changes_df['change'].value_counts()
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("New", int(change_counts.get('new', 0)))
+        with col2:
+            st.metric("Changed", int(change_counts.get('changed', 0)))
+        with col3:
+            st.metric("Disappeared", int(change_counts.get('disappeared', 0)))
+
+        if len(changes_df):
+            st.dataframe(changes_df, use_container_width=True, height=300)
+            st.download_button(
+                label="📥 Download changes as CSV",
+                data=changes_df.to_csv(index=False),
+                file_name=f"linkedin_profile_changes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime='text/csv',
+                use_container_width=True
+            )
+        else:
+            st.info("No profile changed since the last run")
 
 st.markdown("---")
 st.markdown("""
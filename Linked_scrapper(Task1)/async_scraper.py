@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from log_pipeline import log_context
+from retry_policy import RetryItem
+
+# How often an idle session checks for retries that have come due
+IDLE_POLL_SECONDS = 0.5
+
+
+class AsyncScraper:
+    # Drives several browser sessions of one logged-in LinkedInScraper from a
+    # single asyncio event loop. Blocking Selenium calls run in a thread pool
+    # bounded to one thread per session and output writes in a thread of their
+    # own, so page loads, waits and disk I/O of all sessions overlap while the
+    # loop only hands out URLs and retries.
+
+    def __init__(self, scraper, concurrency=2):
+        self.scraper = scraper
+        self.concurrency = max(1, concurrency)
+        self._fresh = None
+        self._total = '?'
+        self._in_flight = 0
+        self._closing = False
+        self._browsers = None
+        self._writes = None
+
+    async def iter_profiles(self, profile_urls, output=None, resume=False, diff_output=None, on_profile=None):
+        run = self._run(profile_urls, output, resume, diff_output, on_profile)
+        try:
+            async for _, profile_data in run:
+                yield profile_data
+        finally:
+            await run.aclose()
+
+    async def scrape_profiles(self, profile_urls, output=None, resume=False, diff_output=None, on_profile=None):
+        # Same contract as LinkedInScraper.scrape_profiles: in-memory runs end
+        # up in profiles_data in input order, streaming runs only on disk
+        collected = []
+        async for slot, profile_data in self._run(profile_urls, output, resume, diff_output, on_profile):
+            if not output:
+                collected.append((slot, profile_data))
+        collected.sort(key=lambda entry: entry[0])
+        self.scraper.profiles_data.extend(profile_data for _, profile_data in collected)
+        return self.scraper.profiles_data
+
+    def _next_item(self):
+        retries = self.scraper.retries
+        item = retries.pop_due()
+        if item is not None:
+            return item
+        if self._fresh is None or retries.cooldown_remaining() > 0:
+            return None
+        next_url = next(self._fresh, None)
+        if next_url is None:
+            self._fresh = None
+            return None
+        slot, url = next_url
+        return RetryItem(url, slot)
+
+    def _finished(self):
+        # In-flight attempts may still defer a retry, so they count as work left
+        return self._fresh is None and not len(self.scraper.retries) and not self._in_flight
+
+    def _attempt(self, worker, worker_id, item):
+        with log_context(worker=worker_id):
+            if item.attempt == 0:
+                logging.info(f"[worker {worker_id}] Processing profile {item.slot + 1}/{self._total}")
+            return self.scraper._attempt(worker, item)
+
+    def _record(self, profile_data, writer, missing=None):
+        # Output thread: the file write, change tracking and on_profile callback.
+        # A failed write is logged rather than ending the session
+        try:
+            if writer:
+                writer.write(profile_data, self.scraper._url_key(profile_data['profile_url']))
+            self.scraper._notify_profile(profile_data, missing)
+        except Exception as e:
+            logging.error(f"Could not record {profile_data['profile_url']}: {str(e)}")
+
+    async def _drive(self, worker, worker_id, writer, results):
+        loop = asyncio.get_running_loop()
+        try:
+            while not (self.scraper.stopped or self._closing):
+                item = self._next_item()
+                if item is None:
+                    if self._finished():
+                        break
+                    await asyncio.sleep(IDLE_POLL_SECONDS)
+                    continue
+
+                self._in_flight += 1
+                try:
+                    profile_data = await loop.run_in_executor(self._browsers, self._attempt, worker, worker_id, item)
+                finally:
+                    self._in_flight -= 1
+                if profile_data is None:
+                    continue
+                await loop.run_in_executor(self._writes, self._record, profile_data, writer, item.missing_fields)
+                await results.put((item.slot, profile_data))
+        finally:
+            if worker is not self.scraper:
+                self.scraper._merge_worker_stats(worker)
+                await loop.run_in_executor(self._browsers, worker.close)
+
+    async def _start_session(self, worker_id, session, writer, results):
+        # Extra sessions log in while the first one is already scraping
+        loop = asyncio.get_running_loop()
+        worker = await loop.run_in_executor(self._browsers, self.scraper._spawn_worker, worker_id, session)
+        if worker is not None:
+            await self._drive(worker, worker_id, writer, results)
+
+    async def _run(self, profile_urls, output, resume, diff_output, on_profile):
+        scraper = self.scraper
+        loop = asyncio.get_running_loop()
+        writer, profile_urls = scraper._open_run(profile_urls, output, resume, on_profile, diff_output)
+
+        concurrency = self.concurrency
+        if hasattr(profile_urls, '__len__'):
+            self._total = len(profile_urls)
+            concurrency = max(1, min(concurrency, self._total))
+        self._fresh = enumerate(profile_urls)
+        self._closing = False
+        # Named after the calling thread so per-job log views that filter on
+        # the thread name keep seeing these threads
+        name = threading.current_thread().name
+        self._browsers = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f'{name}-browser')
+        self._writes = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'{name}-output')
+
+        results = asyncio.Queue()
+        tasks = []
+        success_count = 0
+        count = 0
+        try:
+            session = None
+            if concurrency > 1:
+                session = await loop.run_in_executor(self._browsers, scraper._worker_session)
+
+            logging.info(f"Driving {concurrency} browser sessions from one event loop for {self._total} profiles")
+            tasks.append(asyncio.create_task(self._drive(scraper, 1, writer, results)))
+            for worker_id in range(2, concurrency + 1):
+                tasks.append(asyncio.create_task(self._start_session(worker_id, session, writer, results)))
+
+            async def sessions_done(sessions):
+                try:
+                    await asyncio.gather(*sessions)
+                finally:
+                    await results.put(None)
+
+            tasks.append(asyncio.create_task(sessions_done(list(tasks))))
+
+            while True:
+                entry = await results.get()
+                if entry is None:
+                    break
+                count += 1
+                success_count += entry[1]['status'] == 'success'
+                yield entry
+            # Surfaces a session that died with an exception
+            await tasks[-1]
+
+            for item in scraper._deferred_results(writer):
+                await loop.run_in_executor(self._writes, self._record, item.profile, writer, item.missing_fields)
+                yield item.slot, item.profile
+            scraper._log_run_summary(success_count, count)
+        finally:
+            # Pages already loading are allowed to finish before the browsers close
+            self._closing = True
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._browsers.shutdown()
+            self._writes.shutdown()
+            scraper._close_run(writer, output, diff_output)
@@ -0,0 +1,171 @@
+import argparse
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+
+from linkedin_scraper import LinkedInScraper
+from log_pipeline import configure_logging
+from proc_stats import descendants, read_proc_stats
+from profile_fields import PROFILE_FIELDS
+from rate_controller import RateController
+from standin_server import start_standin_server
+
+
+class BrowserResourceSampler:
+    # Samples RSS and CPU time of every process below this one (chromedriver
+    # and the Chrome processes it spawns). Linux only; reports nothing elsewhere.
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self.peak_rss = 0
+        self.cpu_seconds = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='resource-sampler', daemon=True)
+
+    def start(self):
+        if os.path.isdir('/proc'):
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.is_set():
+            stats = read_proc_stats()
+            pids = descendants(stats, os.getpid())
+            self.peak_rss = max(self.peak_rss, sum(stats[pid][2] for pid in pids))
+            for pid in pids:
+                self.cpu_seconds[pid] = stats[pid][1]
+            self.samples += 1
+            self._stop.wait(self.interval)
+
+
+class TimedScraper(LinkedInScraper):
+    timings = []
+    timings_lock = threading.Lock()
+
+    def get_profile(self, profile_url, fields=None):
+        start = time.perf_counter()
+        profile_data = super().get_profile(profile_url, fields)
+        with self.timings_lock:
+            self.timings.append(time.perf_counter() - start)
+        return profile_data
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_benchmark(profiles=20, workers=1, latency=0.0, render_delay=0.5, failure_rate=0.0,
+                  scraper_options=None, seed=1):
+    server, base_url = start_standin_server(
+        latency=latency,
+        render_delay=render_delay,
+        failure_rate=failure_rate,
+        seed=seed
+    )
+    profile_urls = [f'{base_url}/in/bench-profile-{idx}/' for idx in range(profiles)]
+
+    TimedScraper.timings = []
+    options = {'rate_controller': RateController(per_minute=None), 'retry_base_delay': 1}
+    options.update(scraper_options or {})
+    scraper = TimedScraper('bench@example.com', 'password', base_url=base_url, **options)
+
+    sampler = BrowserResourceSampler()
+    sampler.start()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    try:
+        startup_start = time.perf_counter()
+        scraper.setup_driver()
+        if not scraper.login():
+            raise RuntimeError("Login against the stand-in server failed")
+        startup = time.perf_counter() - startup_start
+
+        scrape_start = time.perf_counter()
+        scraper.scrape_profiles(profile_urls, workers=workers)
+        scrape_elapsed = time.perf_counter() - scrape_start
+    finally:
+        scraper.close()
+        sampler.stop()
+        server.shutdown()
+    wall = time.perf_counter() - wall_start
+
+    timings = TimedScraper.timings
+    statuses = {}
+    for profile in scraper.profiles_data:
+        statuses[profile['status']] = statuses.get(profile['status'], 0) + 1
+    browser_cpu = sum(sampler.cpu_seconds.values())
+
+    return {
+        'profiles': profiles,
+        'workers': workers,
+        'server': {'latency': latency, 'render_delay': render_delay, 'failure_rate': failure_rate},
+        'scraper_options': {name: value for name, value in options.items() if isinstance(value, (str, int, float, bool, tuple))},
+        'startup_seconds': round(startup, 3),
+        'scrape_seconds': round(scrape_elapsed, 3),
+        'profiles_per_minute': round(profiles / scrape_elapsed * 60, 2) if scrape_elapsed else 0.0,
+        'latency_p50_seconds': round(percentile(timings, 50), 3),
+        'latency_p95_seconds': round(percentile(timings, 95), 3),
+        'latency_mean_seconds': round(statistics.mean(timings), 3) if timings else 0.0,
+        'statuses': statuses,
+        'browser_peak_rss_mb': round(sampler.peak_rss / 1024 / 1024, 1),
+        'browser_cpu_seconds': round(browser_cpu, 2),
+        'browser_cpu_percent': round(browser_cpu / wall * 100, 1) if wall else 0.0,
+        'python_cpu_seconds': round(time.process_time() - cpu_start, 2),
+        'metrics': scraper.metrics.summary(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LinkedInScraper against a local stand-in server")
+    parser.add_argument('--profiles', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--latency', type=float, default=0.0, help="Server response latency in seconds")
+    parser.add_argument('--render-delay', type=float, default=0.5, help="Client-side render delay in seconds")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="Share of profile pages answered with 500")
+    parser.add_argument('--extraction-mode', choices=['script', 'webdriver'], default='script')
+    parser.add_argument('--wait-floor', type=float, default=0.5)
+    parser.add_argument('--wait-ceiling', type=float, default=15)
+    parser.add_argument('--lightweight', action='store_true', help="Headless Chrome with resource blocking")
+    parser.add_argument('--fast-path', action='store_true', help="Try the HTTP fast path first")
+    parser.add_argument('--fields', nargs='+', choices=PROFILE_FIELDS, help="Only collect these fields")
+    parser.add_argument('--output', help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    configure_logging(level=logging.WARNING)
+
+    report = run_benchmark(
+        profiles=args.profiles,
+        workers=args.workers,
+        latency=args.latency,
+        render_delay=args.render_delay,
+        failure_rate=args.failure_rate,
+        scraper_options={
+            'extraction_mode': args.extraction_mode,
+            'wait_floor': args.wait_floor,
+            'wait_ceiling': args.wait_ceiling,
+            'lightweight': args.lightweight,
+            'fast_path': args.fast_path,
+            'fields': args.fields,
+        }
+    )
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from profile_fields import PROFILE_FIELDS, fieldnames_for
+from profile_urls import normalize_profile_url
+from retry_policy import PERMANENT, classify_status
+
+# Fields whose edits count as a change; name is matched on but not watched
+TRACKED_FIELDS = ('headline', 'location', 'about')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profile_fingerprints (
+    url TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    last_changed REAL NOT NULL,
+    gone_at REAL
+);
+"""
+
+
+def _clean(value):
+    return ' '.join((value or '').split())
+
+
+def profile_fingerprint(values):
+    joined = '\x1f'.join(_clean(values.get(field)) for field in TRACKED_FIELDS)
+    return hashlib.sha256(joined.encode('utf-8')).hexdigest()
+
+
+def change_fieldnames(fields=None):
+    return ['change', 'changed_fields'] + fieldnames_for(fields)
+
+
+class ChangeTracker:
+    # Remembers the last seen headline/location/about of every profile,
+    # keyed by normalized URL, and turns each fresh result into a delta:
+    # new, changed, disappeared (now 404 or restricted), or nothing at all.
+
+    def __init__(self, path='profile_changes.db'):
+        self.path = path
+        self.counts = {'new': 0, 'changed': 0, 'disappeared': 0, 'unchanged': 0}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def observe(self, profile, fields=PROFILE_FIELDS, missing=None):
+        # missing: fields the page should have had but didn't render; they
+        # are left out of the comparison instead of reading as wiped
+        key = normalize_profile_url(profile['profile_url'])
+        if key is None:
+            return None
+
+        kind = classify_status(profile['status'])
+        if kind is None:
+            return self._observe_success(key, profile, fields, missing or ())
+        if kind == PERMANENT:
+            return self._observe_gone(key, profile)
+        # Transient failures say nothing about the profile itself
+        return None
+
+    def _observe_success(self, key, profile, fields, missing):
+        now = time.time()
+        watched = [field for field in TRACKED_FIELDS if field in fields and field not in missing]
+
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT fingerprint, data, gone_at FROM profile_fingerprints WHERE url = ?',
+                (key,)
+            ).fetchone()
+
+            if row is None or row[2] is not None:
+                values = {field: _clean(profile.get(field)) for field in watched}
+                values['name'] = _clean(profile.get('name'))
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO profile_fingerprints'
+                    ' (url, fingerprint, data, first_seen, last_seen, last_changed, gone_at)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, NULL)',
+                    (key, profile_fingerprint(values), json.dumps(values), now, now, now)
+                )
+                self._conn.commit()
+                change, changed_fields = 'new', watched
+            else:
+                values = json.loads(row[1])
+                # Fields an earlier field-selective run never collected become
+                # a baseline rather than a change
+                changed_fields = [
+                    field for field in watched
+                    if field in values and _clean(profile.get(field)) != values[field]
+                ]
+                values.update({field: _clean(profile.get(field)) for field in watched})
+                if profile.get('name'):
+                    values['name'] = _clean(profile['name'])
+                fingerprint = profile_fingerprint(values)
+                change = 'changed' if changed_fields else None
+                if fingerprint == row[0]:
+                    self._conn.execute('UPDATE profile_fingerprints SET last_seen = ? WHERE url = ?', (now, key))
+                else:
+                    self._conn.execute(
+                        'UPDATE profile_fingerprints SET fingerprint = ?, data = ?, last_seen = ?,'
+                        ' last_changed = CASE WHEN ? THEN ? ELSE last_changed END WHERE url = ?',
+                        (fingerprint, json.dumps(values), now, bool(change), now, key)
+                    )
+                self._conn.commit()
+
+            self.counts[change or 'unchanged'] += 1
+
+        if change is None:
+            return None
+        return dict(profile, change=change, changed_fields=';'.join(changed_fields))
+
+    def _observe_gone(self, key, profile):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM profile_fingerprints WHERE url = ? AND gone_at IS NULL',
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE profile_fingerprints SET gone_at = ? WHERE url = ?', (time.time(), key))
+            self._conn.commit()
+            self.counts['disappeared'] += 1
+
+        # Report the last known values so the CRM knows what went away
+        return dict(profile, change='disappeared', changed_fields='', **json.loads(row[0]))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ChangeWriter:
+    # Delta CSV for downstream sync; appends when resuming an interrupted run
+
+    def __init__(self, path, fields=None, resume=False):
+        self.path = path
+        append = resume and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=change_fieldnames(fields), extrasaction='ignore')
+        if not append:
+            self._writer.writeheader()
+        self._lock = threading.Lock()
+
+    def write(self, change):
+        with self._lock:
+            self._writer.writerow(change)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
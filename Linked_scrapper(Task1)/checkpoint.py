@@ -0,0 +1,114 @@
+import csv
+import logging
+import os
+import threading
+
+from profile_urls import normalize_profile_url
+
+
+class CheckpointWriter:
+    # Appends each record to a CSV as soon as it completes and keeps a journal
+    # of "<csv byte offset>\t<url key>" lines next to it. On resume the CSV is
+    # cut back to the last journaled offset, so a crash mid-row never leaves a
+    # torn record behind, and every journaled URL can be skipped.
+
+    def __init__(self, path, fieldnames, resume=False, fsync_every=10):
+        self.path = path
+        self.journal_path = f'{path}.journal'
+        self.fieldnames = fieldnames
+        self.fsync_every = fsync_every
+        self.completed_urls = set()
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        if resume:
+            offset = self._load_journal()
+            self._file = open(path, 'a+', newline='', encoding='utf-8')
+            self._file.truncate(offset)
+            self._file.seek(offset)
+        else:
+            self._file = open(path, 'w', newline='', encoding='utf-8')
+            open(self.journal_path, 'w').close()
+
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+
+        if self._file.tell() == 0:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def _load_journal(self):
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            # Nothing to resume; a journal left behind would point into a file that is gone
+            open(self.journal_path, 'w').close()
+            return 0
+
+        offset = 0
+        valid_lines = []
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as journal:
+                for line in journal:
+                    if not line.endswith('\n'):
+                        break
+                    record_offset, _, key = line.rstrip('\n').partition('\t')
+                    if not record_offset.isdigit() or int(record_offset) > size:
+                        break
+                    offset = int(record_offset)
+                    self.completed_urls.add(key)
+                    valid_lines.append(line)
+        except FileNotFoundError:
+            return self._rebuild_journal(size)
+
+        with open(self.journal_path, 'w', encoding='utf-8') as journal:
+            journal.writelines(valid_lines)
+
+        logging.info(f"Checkpoint found {len(self.completed_urls)} completed profiles in {self.path}")
+        return offset
+
+    def _rebuild_journal(self, size):
+        # Output written without a journal (e.g. by save_to_csv): trust the
+        # rows that are there and journal them all at the current file size
+        with open(self.path, 'r', newline='', encoding='utf-8') as f:
+            # Same keys as the scraper's _url_key, so resume matches any form of the URL
+            keys = [
+                normalize_profile_url(row['profile_url']) or row['profile_url'].strip()
+                for row in csv.DictReader(f) if row.get('profile_url')
+            ]
+
+        with open(self.journal_path, 'w', encoding='utf-8') as journal:
+            for key in keys:
+                journal.write(f'{size}\t{key}\n')
+
+        self.completed_urls.update(keys)
+        logging.info(f"Rebuilt checkpoint journal with {len(keys)} profiles from {self.path}")
+        return size
+
+    def write(self, record, key):
+        with self._lock:
+            self._writer.writerow(record)
+            self._file.flush()
+            self._journal.write(f'{self._file.tell()}\t{key}\n')
+            self._journal.flush()
+            self.completed_urls.add(key)
+
+            self._pending += 1
+            if self._pending >= self.fsync_every:
+                self._sync()
+
+    def _sync(self):
+        # Data before journal, so the journal never points past durable rows
+        os.fsync(self._file.fileno())
+        os.fsync(self._journal.fileno())
+        self._pending = 0
+
+    def close(self):
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            self._journal.flush()
+            self._sync()
+            self._file.close()
+            self._journal.close()
@@ -0,0 +1,195 @@
+import logging
+import queue
+import threading
+import time
+
+from proc_stats import process_tree_rss
+
+CRASH_MARKERS = (
+    'invalid session id',
+    'no such window',
+    'chrome not reachable',
+    'disconnected',
+    'session deleted because of page crash',
+    'tab crashed',
+    'target window already closed',
+)
+
+
+def is_driver_crash(error):
+    message = str(error).lower()
+    return any(marker in message for marker in CRASH_MARKERS)
+
+
+def driver_rss(driver):
+    # chromedriver plus every Chrome process it started
+    try:
+        return process_tree_rss(driver.service.process.pid)
+    except AttributeError:
+        return 0
+
+
+class DriverManager:
+    # Starts up to `prewarm` spare drivers in the background so recycling does
+    # not wait for a cold Chrome launch. A driver is due for recycling once it
+    # has served max_pages pages or its process tree grows past max_rss_mb;
+    # spares are only launched once it gets within warm_ahead of either limit,
+    # so a worker doesn't carry an idle second Chrome for the whole run.
+    # Retired drivers are quit in the background.
+
+    def __init__(self, factory, prewarm=1, max_pages=None, max_rss_mb=None, warm_url=None, warm_ahead=0.9):
+        self.factory = factory
+        self.prewarm = prewarm
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.warm_url = warm_url
+        self.warm_ahead = warm_ahead
+        self.created = 0
+        self.recycled = 0
+        self._ready = queue.Queue()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self):
+        with self._lock:
+            missing = self.prewarm - self._ready.qsize() - self._pending
+        for _ in range(max(0, missing)):
+            self._spawn_async()
+
+    def _spawn_async(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._pending += 1
+        name = f"{threading.current_thread().name}-driver-warmup"
+        threading.Thread(target=self._spawn, name=name, daemon=True).start()
+
+    def _spawn(self):
+        driver = None
+        try:
+            driver = self._create()
+        except Exception as e:
+            logging.error(f"Could not pre-warm a Chrome driver: {str(e)}")
+        with self._lock:
+            self._pending -= 1
+            closed = self._closed
+        if driver is None:
+            # Wake anyone waiting in acquire() so they launch their own
+            self._ready.put(None)
+            return
+        if closed:
+            self._quit(driver)
+            return
+        self._ready.put(driver)
+
+    def _create(self):
+        driver = self.factory()
+        with self._lock:
+            self.created += 1
+        if self.warm_url:
+            try:
+                driver.get(self.warm_url)
+            except Exception as e:
+                logging.debug(f"Warm-up load of {self.warm_url} failed: {str(e)}")
+        return driver
+
+    def acquire(self):
+        with self._lock:
+            pending = self._pending
+        try:
+            # Wait for a warm-up already in flight rather than launching another Chrome
+            driver = self._ready.get(block=pending > 0)
+        except queue.Empty:
+            driver = None
+        if driver is None:
+            driver = self._create()
+        return driver
+
+    def should_recycle(self, driver, pages):
+        if self.max_pages and pages >= self.max_pages:
+            return f'{pages} pages'
+        near_limit = bool(self.max_pages and pages >= self.max_pages * self.warm_ahead)
+        if self.max_rss_mb:
+            rss_mb = driver_rss(driver) / 1024 / 1024
+            if rss_mb >= self.max_rss_mb:
+                return f'{rss_mb:.0f} MB RSS'
+            near_limit = near_limit or rss_mb >= self.max_rss_mb * self.warm_ahead
+        if near_limit:
+            self.start()
+        return None
+
+    def release(self, driver):
+        with self._lock:
+            self.recycled += 1
+        threading.Thread(target=self._quit, args=(driver,), name='driver-retire', daemon=True).start()
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.debug(f"Error while quitting a retired driver: {str(e)}")
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                driver = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            if driver is not None:
+                self._quit(driver)
+
+
+class WarmDriverPool:
+    # Server-wide pre-warmed browsers for long-running front ends such as the
+    # Streamlit app. At most max_size are kept (one per key, e.g. headless or
+    # not), and one that nobody has asked for in idle_seconds is quit, so
+    # abandoned sessions don't leave Chrome running.
+
+    def __init__(self, launcher, max_size=1, idle_seconds=300, reap_interval=30):
+        self.launcher = launcher
+        self.max_size = max_size
+        self.idle_seconds = idle_seconds
+        self.reap_interval = reap_interval
+        self._warm = {}
+        self._lock = threading.Lock()
+        self._reaper = None
+
+    def warm(self, key):
+        # Launches a DriverManager for key unless one is already warm (which
+        # then counts as used) or the pool is full
+        with self._lock:
+            if key in self._warm:
+                self._warm[key][1] = time.monotonic()
+                return
+            if len(self._warm) >= self.max_size:
+                return
+            self._warm[key] = [self.launcher(key), time.monotonic()]
+            if self._reaper is None:
+                self._reaper = threading.Thread(target=self._reap, name='warm-driver-reaper', daemon=True)
+                self._reaper.start()
+
+    def take(self, key):
+        with self._lock:
+            entry = self._warm.pop(key, None)
+        return entry[0] if entry else None
+
+    def _reap(self):
+        while True:
+            time.sleep(self.reap_interval)
+            now = time.monotonic()
+            with self._lock:
+                idle = [key for key, (_, used_at) in self._warm.items() if now - used_at >= self.idle_seconds]
+                managers = [self._warm.pop(key)[0] for key in idle]
+            for driver_manager in managers:
+                logging.info("Quitting a pre-warmed browser nobody used")
+                driver_manager.close()
+
+    def close(self):
+        with self._lock:
+            managers = [driver_manager for driver_manager, _ in self._warm.values()]
+            self._warm = {}
+        for driver_manager in managers:
+            driver_manager.close()
@@ -0,0 +1,134 @@
+import csv
+import hashlib
+import json
+import logging
+import os
+
+from profile_fields import PROFILE_FIELDNAMES
+
+EXPORT_FORMATS = {
+    'csv': {'label': 'CSV', 'extension': '.csv', 'mime': 'text/csv'},
+    'xlsx': {
+        'label': 'Excel',
+        'extension': '.xlsx',
+        'mime': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    },
+    'jsonl': {'label': 'JSON Lines', 'extension': '.jsonl', 'mime': 'application/x-ndjson'},
+    'parquet': {'label': 'Parquet', 'extension': '.parquet', 'mime': 'application/vnd.apache.parquet'},
+}
+
+# All writers consume records one at a time from any iterable, so exports of
+# large result sets never need the whole set in memory at once.
+
+
+def write_csv(records, fileobj, fieldnames=PROFILE_FIELDNAMES):
+    writer = csv.DictWriter(fileobj, fieldnames=fieldnames, extrasaction='ignore')
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(record)
+        count += 1
+    return count
+
+
+def write_jsonl(records, fileobj, fieldnames=PROFILE_FIELDNAMES):
+    count = 0
+    for record in records:
+        fileobj.write(json.dumps({field: record.get(field, '') for field in fieldnames}, ensure_ascii=False))
+        fileobj.write('\n')
+        count += 1
+    return count
+
+
+def write_xlsx(records, path, fieldnames=PROFILE_FIELDNAMES, sheet_name='LinkedIn Profiles'):
+    from openpyxl import Workbook
+
+    # write_only mode streams rows to disk instead of building the sheet in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    sheet.append(fieldnames)
+    count = 0
+    for record in records:
+        sheet.append([record.get(field, '') for field in fieldnames])
+        count += 1
+    workbook.save(path)
+    return count
+
+
+def write_parquet(records, path, fieldnames=PROFILE_FIELDNAMES, batch_size=5000):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export requires the pyarrow package")
+
+    schema = pa.schema([(field, pa.string()) for field in fieldnames])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch or count == 0:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def export_records(records, path, fmt, fieldnames=PROFILE_FIELDNAMES):
+    if fmt == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            return write_csv(records, f, fieldnames)
+    if fmt == 'jsonl':
+        with open(path, 'w', encoding='utf-8') as f:
+            return write_jsonl(records, f, fieldnames)
+    if fmt == 'xlsx':
+        return write_xlsx(records, path, fieldnames)
+    if fmt == 'parquet':
+        return write_parquet(records, path, fieldnames)
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+class ExportCache:
+    # Export artifacts on disk, named by a hash of the result set they were
+    # built from. They are only generated when first requested and reused
+    # until the result set changes.
+
+    def __init__(self, directory='exports', max_files=50):
+        self.directory = directory
+        self.max_files = max_files
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, result_key, fmt, fieldnames):
+        key = f"{result_key}|{','.join(fieldnames)}"
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:24]
+        return os.path.join(self.directory, f'{digest}{EXPORT_FORMATS[fmt]["extension"]}')
+
+    def get(self, result_key, fmt, fieldnames=PROFILE_FIELDNAMES):
+        path = self._path(result_key, fmt, fieldnames)
+        return path if os.path.exists(path) else None
+
+    def create(self, result_key, fmt, records, fieldnames=PROFILE_FIELDNAMES):
+        path = self._path(result_key, fmt, fieldnames)
+        tmp_path = f'{path}.{os.getpid()}.tmp{EXPORT_FORMATS[fmt]["extension"]}'
+        try:
+            count = export_records(records, tmp_path, fmt, fieldnames)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        logging.info(f"Exported {count} profiles to {path}")
+        self._prune()
+        return path
+
+    def _prune(self):
+        files = [os.path.join(self.directory, name) for name in os.listdir(self.directory)]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for path in files[self.max_files:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
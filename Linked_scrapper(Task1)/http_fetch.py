@@ -0,0 +1,48 @@
+import logging
+
+import urllib3
+
+DEFAULT_HEADERS = {
+    'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'accept-language': 'en-US,en;q=0.9',
+}
+
+
+class HttpProfileFetcher:
+    # Fetches profile pages over a pooled keep-alive HTTP client, reusing the
+    # cookies of an authenticated browser session. No redirects are followed:
+    # a redirect means the session was bounced to a login or authwall page.
+
+    def __init__(self, cookies, user_agent=None, pool_size=4, timeout=15):
+        self.http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=pool_size,
+            block=True,
+            retries=False,
+            timeout=urllib3.Timeout(connect=5, read=timeout)
+        )
+        self.headers = dict(DEFAULT_HEADERS)
+        self.headers['cookie'] = '; '.join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+        if user_agent:
+            self.headers['user-agent'] = user_agent
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        user_agent = driver.execute_script("return navigator.userAgent;")
+        return cls(driver.get_cookies(), user_agent=user_agent, **kwargs)
+
+    def fetch(self, profile_url):
+        try:
+            response = self.http.request('GET', profile_url, headers=self.headers, redirect=False)
+        except urllib3.exceptions.HTTPError as e:
+            logging.warning(f"HTTP fetch failed for {profile_url}: {str(e)}")
+            return None
+
+        if response.status != 200:
+            logging.info(f"HTTP fetch of {profile_url} returned {response.status}")
+            return None
+
+        return response.data.decode('utf-8', errors='replace')
+
+    def close(self):
+        self.http.clear()
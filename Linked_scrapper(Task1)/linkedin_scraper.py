@@ -1,38 +1,274 @@
-import csv
+import os
+import sys
+import atexit
+import asyncio
+import argparse
+import getpass
 import time
 import random
+import threading
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 import logging
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scraper.log'),
-        logging.StreamHandler()
-    ]
+from session_store import SessionStore
+from result_cache import ResultCache
+from checkpoint import CheckpointWriter
+from exporters import write_csv
+from metrics import ScraperMetrics, timed
+from log_pipeline import configure_logging, log_context, set_log_context
+from profile_urls import normalize_profile_url, iter_profile_urls, read_profile_urls
+from snapshot_store import SnapshotStore
+from http_fetch import HttpProfileFetcher
+from driver_manager import DriverManager, is_driver_crash
+from work_queue import LeaseHeartbeat, default_worker_id, open_work_queue
+from rate_controller import BLOCKED, SLOW, RateController
+from change_tracker import ChangeTracker, ChangeWriter
+from async_scraper import AsyncScraper
+from retry_policy import PARTIAL, PERMANENT, THROTTLED, RetryItem, RetryScheduler, classify_page, classify_status
+from profile_parser import parse_profile_page
+from profile_fields import (
+    PROFILE_FIELDS,
+    empty_profile,
+    fieldnames_for,
+    select_fields,
+    HEADLINE_SELECTOR,
+    LOCATION_SELECTOR,
+    ABOUT_SECTION_SELECTOR,
+    ABOUT_MAX_LENGTH,
+    is_valid_name,
 )
 
+# The top card every profile renders first; #about is left out because many
+# profiles have no About section, and the extraction step looks for it instead
+TOP_CARD_LOCATOR = (By.TAG_NAME, "h1")
+PROFILE_READY_LOCATORS = {
+    'name': TOP_CARD_LOCATOR,
+    'headline': (By.CSS_SELECTOR, HEADLINE_SELECTOR),
+    'location': (By.CSS_SELECTOR, LOCATION_SELECTOR),
+}
+
+# Collects every profile field in a single WebDriver round trip. Scrolls the
+# #about anchor into view and polls for the lazily rendered about section
+# before reporting back; missing elements come back as null.
+EXTRACT_PROFILE_SCRIPT = """
+const [headlineSelector, locationSelector, aboutSelector, timeoutMs, wantAbout, done] = arguments;
+const textOf = (el) => el ? (el.innerText || el.textContent || '') : null;
+const collect = (withAbout) => {
+    const aboutSection = withAbout ? document.querySelector(aboutSelector) : null;
+    const aboutSpan = aboutSection ? aboutSection.querySelector('span') : null;
+    done({
+        h1: Array.from(document.getElementsByTagName('h1')).map(textOf),
+        headline: textOf(document.querySelector(headlineSelector)),
+        location: textOf(document.querySelector(locationSelector)),
+        about: textOf(aboutSpan),
+        hasAbout: !!document.getElementById('about')
+    });
+};
+const anchor = document.getElementById('about');
+if (!anchor || !wantAbout) {
+    collect(false);
+} else {
+    anchor.scrollIntoView(true);
+    const deadline = Date.now() + timeoutMs;
+    const poll = () => {
+        if (document.querySelector(aboutSelector) || Date.now() > deadline) {
+            collect(true);
+        } else {
+            setTimeout(poll, 100);
+        }
+    };
+    poll();
+}
+"""
+
+PAGE_STATE_SCRIPT = "return [window.location.href, document.title, document.body ? document.body.innerText.slice(0, 3000) : ''];"
+
+# Requests the lightweight profile drops at the network layer: we only read
+# text, so images, fonts, media and analytics beacons are pure overhead.
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.m3u8', '*.ts', '*.mp3', '*.ogg',
+    '*media.licdn.com/dms/image*',
+    '*media.licdn.com/playlist*',
+    '*px.ads.linkedin.com*',
+    '*snap.licdn.com*',
+    '*linkedin.com/li/track*',
+    '*linkedin.com/sensorCollect*',
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*bat.bing.com*',
+    '*connect.facebook.net*',
+]
+
+LINKEDIN_URL = 'https://www.linkedin.com'
+
+# Cheap authenticated request used to check a restored session: the
+# voyager "me" endpoint answers 200 only for a live login.
+CHECK_SESSION_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const match = document.cookie.match(/JSESSIONID="?([^";]+)/);
+fetch('/voyager/api/me', {
+    credentials: 'include',
+    headers: {'csrf-token': match ? match[1] : '', 'accept': 'application/json'}
+}).then((response) => done(response.status)).catch(() => done(0));
+"""
+
+LOGGED_IN_URL_MARKERS = ('feed', 'mynetwork')
+LOGIN_SETTLED_URL_MARKERS = LOGGED_IN_URL_MARKERS + ('checkpoint', 'challenge')
+
+
 class LinkedInScraper:
 
-    def __init__(self, email, password):
+    def __init__(self, email, password, wait_floor=0.5, wait_ceiling=15, extraction_mode='script',
+                 lightweight=False, session_store=None, result_cache=None, force_refresh=False,
+                 snapshot_store=None, fast_path=False, base_url=LINKEDIN_URL, rate_controller=None,
+                 metrics=None, recycle_after_pages=None, max_driver_rss_mb=None, prewarm_drivers=0,
+                 max_attempts=3, retry_base_delay=30, fields=None, change_tracker=None,
+                 driver_manager=None):
         self.email = email
         self.password = password
+        self.lightweight = lightweight
+        self.session_store = session_store
+        self.result_cache = result_cache
+        self.force_refresh = force_refresh
+        self.snapshot_store = snapshot_store
+        self.fast_path = fast_path
+        self.base_url = base_url.rstrip('/')
+        self.http_fetcher = None
+        self.fast_path_hits = 0
+        self.cache_hits = 0
+        self.fresh_scrapes = 0
+        self._stats_lock = threading.Lock()
+        self._stop_requested = threading.Event()
+        self._on_profile = None
+        self.wait_floor = wait_floor
+        self.wait_ceiling = wait_ceiling
+        self.extraction_mode = extraction_mode
+        self.rate_controller = rate_controller or RateController()
+        self.metrics = metrics or ScraperMetrics()
+        self.recycle_after_pages = recycle_after_pages
+        self.max_driver_rss_mb = max_driver_rss_mb
+        self.prewarm_drivers = prewarm_drivers
+        self.driver_manager = driver_manager
+        if driver_manager is not None:
+            # A browser pre-warmed with prewarm_browser() before this scraper existed
+            driver_manager.prewarm = prewarm_drivers
+            driver_manager.max_pages = recycle_after_pages
+            driver_manager.max_rss_mb = max_driver_rss_mb
+        self.drivers_recycled = 0
+        self._pages_on_driver = 0
+        self._last_session = None
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retries = None
+        self.last_missing_fields = []
+        self.last_ready_timed_out = False
+        self.fields = select_fields(fields)
+        self.fieldnames = fieldnames_for(self.fields)
+        self.change_tracker = change_tracker
+        self.changes = []
+        self._change_writer = None
         self.driver = None
         self.profiles_data = []
 
+    def _worker_options(self):
+        return {
+            'wait_floor': self.wait_floor,
+            'wait_ceiling': self.wait_ceiling,
+            'extraction_mode': self.extraction_mode,
+            'lightweight': self.lightweight,
+            'session_store': self.session_store,
+            'result_cache': self.result_cache,
+            'force_refresh': self.force_refresh,
+            'snapshot_store': self.snapshot_store,
+            'fast_path': self.fast_path,
+            'base_url': self.base_url,
+            'rate_controller': self.rate_controller,
+            'metrics': self.metrics,
+            'recycle_after_pages': self.recycle_after_pages,
+            'max_driver_rss_mb': self.max_driver_rss_mb,
+            'prewarm_drivers': self.prewarm_drivers,
+            'max_attempts': self.max_attempts,
+            'retry_base_delay': self.retry_base_delay,
+            'fields': self.fields,
+        }
+
+    def _pause(self):
+        if self.wait_floor > 0:
+            time.sleep(random.uniform(self.wait_floor, self.wait_floor * 2))
+
+    def _wait_until(self, condition, description):
+        # Returns as soon as the condition holds, but never faster than the floor
+        # and never slower than the ceiling
+        start = time.monotonic()
+        try:
+            WebDriverWait(self.driver, self.wait_ceiling, poll_frequency=0.2).until(condition)
+            ready = True
+        except TimeoutException:
+            logging.warning(f"Timed out after {self.wait_ceiling}s waiting for {description}")
+            self.metrics.increment('timeout', phase=description)
+            ready = False
+
+        remaining = self.wait_floor - (time.monotonic() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+        return ready
+
+    def wait_for_profile_ready(self, fields=None):
+        # Waits for the top card, plus the headline/location if they were asked for
+        locators = [TOP_CARD_LOCATOR]
+        for field in fields or self.fields:
+            locator = PROFILE_READY_LOCATORS.get(field)
+            if locator and locator not in locators:
+                locators.append(locator)
+        return self._wait_until(
+            EC.all_of(*[EC.presence_of_element_located(locator) for locator in locators]),
+            "profile page"
+        )
+
+    @timed('setup_driver')
     def setup_driver(self):
+        if self.driver_manager or self.recycle_after_pages or self.max_driver_rss_mb or self.prewarm_drivers:
+            if self.driver_manager is None:
+                self.driver_manager = DriverManager(
+                    self._create_driver,
+                    prewarm=self.prewarm_drivers,
+                    max_pages=self.recycle_after_pages,
+                    max_rss_mb=self.max_driver_rss_mb,
+                    warm_url=f'{self.base_url}/login'
+                )
+            self.driver = self.driver_manager.acquire()
+        else:
+            self.driver = self._create_driver()
+        self._pages_on_driver = 0
+
+    def _create_driver(self):
         chrome_options = Options()
 
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--start-maximized')
+
+        if self.lightweight:
+            chrome_options.add_argument('--headless=new')
+            chrome_options.add_argument('--window-size=1366,900')
+            chrome_options.add_argument('--disable-gpu')
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--mute-audio')
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.media_stream': 2,
+                'profile.default_content_setting_values.notifications': 2,
+            })
+        else:
+            chrome_options.add_argument('--start-maximized')
 
         user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -45,36 +281,129 @@ class LinkedInScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
 
-        self.driver = webdriver.Chrome(options=chrome_options)
+        driver = webdriver.Chrome(options=chrome_options)
+
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        driver.set_script_timeout(self.wait_ceiling + 5)
 
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.lightweight:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            logging.info("Chrome driver initialized successfully (headless, resource blocking enabled)")
+            return driver
 
         logging.info("Chrome driver initialized successfully")
+        return driver
 
-    def login(self):
+    def _recycle_driver(self, reason):
+        logging.info(f"Recycling Chrome driver ({reason})")
+        with self.metrics.span('driver_recycle'):
+            try:
+                session = self.export_session()
+            except Exception:
+                # The old browser is gone; fall back to the last session known to work
+                session = self._last_session
+
+            old_driver = self.driver
+            self.setup_driver()
+            if self.driver_manager:
+                self.driver_manager.release(old_driver)
+            else:
+                try:
+                    old_driver.quit()
+                except Exception:
+                    pass
+
+            with self._stats_lock:
+                self.drivers_recycled += 1
+            self.metrics.increment('driver_recycled')
+            if not self.login(session=session):
+                logging.error("Could not log in again after recycling the driver")
+
+    def _after_page(self, profile_data):
+        self._pages_on_driver += 1
+        if profile_data['status'].startswith('error') and is_driver_crash(profile_data['status']):
+            self._recycle_driver('browser crashed')
+            return True
+        if self.driver_manager:
+            reason = self.driver_manager.should_recycle(self.driver, self._pages_on_driver)
+            if reason:
+                self._recycle_driver(reason)
+        return False
+
+    def export_session(self):
+        return {
+            'cookies': self.driver.get_cookies(),
+            'local_storage': self.driver.execute_script("return Object.assign({}, window.localStorage);"),
+            'saved_at': time.time()
+        }
+
+    def restore_session(self, session):
         try:
-            logging.info("Attempting to log in to LinkedIn...")
-            self.driver.get('https://www.linkedin.com/login')
+            # Cookies can only be set for the domain that is currently loaded
+            self.driver.get(f'{self.base_url}/robots.txt')
+
+            for cookie in session.get('cookies', []):
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    logging.debug(f"Skipped cookie {cookie.get('name')} for {cookie.get('domain')}")
+
+            if session.get('local_storage'):
+                self.driver.execute_script(
+                    "for (const [key, value] of Object.entries(arguments[0])) { window.localStorage.setItem(key, value); }",
+                    session['local_storage']
+                )
+
+            status = self.driver.execute_async_script(CHECK_SESSION_SCRIPT)
+            if status == 200:
+                logging.info("Restored saved LinkedIn session")
+                return True
+
+            logging.info(f"Saved session has expired (status {status})")
+            self.driver.delete_all_cookies()
+            return False
 
-            time.sleep(random.uniform(2, 4))
+        except Exception as e:
+            logging.warning(f"Could not restore saved session: {str(e)}")
+            return False
+
+    @timed('login')
+    def login(self, session=None):
+        if session is None and self.session_store:
+            session = self.session_store.load(self.email)
+        if session and self.restore_session(session):
+            self._last_session = session
+            return True
+
+        try:
+            logging.info("Attempting to log in to LinkedIn...")
+            self.driver.get(f'{self.base_url}/login')
 
-            email_field = WebDriverWait(self.driver, 10).until(
+            email_field = WebDriverWait(self.driver, self.wait_ceiling).until(
                 EC.presence_of_element_located((By.ID, "username"))
             )
+            self._pause()
             email_field.send_keys(self.email)
 
             password_field = self.driver.find_element(By.ID, "password")
             password_field.send_keys(self.password)
 
-            time.sleep(random.uniform(1, 2))
+            self._pause()
 
             login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             login_button.click()
 
-            time.sleep(random.uniform(5, 7))
+            self._wait_until(
+                lambda driver: any(marker in driver.current_url for marker in LOGIN_SETTLED_URL_MARKERS),
+                "login redirect"
+            )
 
-            if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
+            if any(marker in self.driver.current_url for marker in LOGGED_IN_URL_MARKERS):
                 logging.info("Successfully logged in to LinkedIn")
+                self._last_session = self.export_session()
+                if self.session_store:
+                    self.session_store.save(self.email, self._last_session)
                 return True
             else:
                 logging.error("Login failed - might need verification")
@@ -84,106 +413,594 @@ class LinkedInScraper:
             logging.error(f"Error during login: {str(e)}")
             return False
 
-    def extract_profile_data(self, profile_url):
-        try:
-            logging.info(f"Scraping profile: {profile_url}")
-
-            self.driver.get(profile_url)
-
-            time.sleep(random.uniform(3, 5))
+    def _failed_profile(self, profile_url, status):
+        return empty_profile(profile_url, status)
 
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(random.uniform(2, 3))
+    def _extract_fields_webdriver(self, profile_data, profile_url, fields):
+        # Returns the requested fields the page should have had but didn't render
+        missing = []
 
-            profile_data = {
-                'profile_url': profile_url,
-                'name': '',
-                'headline': '',
-                'location': '',
-                'about': '',
-                'status': 'success'
-            }
-
-            try:
-                h1_elements = self.driver.find_elements(By.TAG_NAME, "h1")
-                for h1 in h1_elements:
+        if 'name' in fields:
+            with self.metrics.span('field_name'):
+                for h1 in self.driver.find_elements(By.TAG_NAME, "h1"):
                     name_text = h1.text.strip()
-                    if name_text and 2 <= len(name_text) <= 100 and not name_text.startswith('http'):
+                    if is_valid_name(name_text):
                         profile_data['name'] = name_text
                         logging.info(f"Found name: {name_text}")
                         break
 
                 if not profile_data['name']:
                     logging.warning(f"Could not extract name from {profile_url}")
-            except Exception as e:
-                logging.warning(f"Error extracting name: {str(e)}")
+                    missing.append('name')
 
-            try:
-                headline_element = self.driver.find_element(By.CSS_SELECTOR, "div.text-body-medium")
-                profile_data['headline'] = headline_element.text.strip()
-            except:
+        if 'headline' in fields:
+            with self.metrics.span('field_headline'):
+                try:
+                    headline_element = self.driver.find_element(By.CSS_SELECTOR, HEADLINE_SELECTOR)
+                    profile_data['headline'] = headline_element.text.strip()
+                except NoSuchElementException:
+                    logging.warning(f"Could not extract headline from {profile_url}")
+                    missing.append('headline')
+
+        if 'location' in fields:
+            with self.metrics.span('field_location'):
+                try:
+                    location_element = self.driver.find_element(By.CSS_SELECTOR, LOCATION_SELECTOR)
+                    profile_data['location'] = location_element.text.strip()
+                except NoSuchElementException:
+                    logging.warning(f"Could not extract location from {profile_url}")
+                    missing.append('location')
+
+        if 'about' in fields:
+            with self.metrics.span('field_about'):
+                about_buttons = self.driver.find_elements(By.ID, "about")
+                # No anchor means the profile has no About section at all
+                if about_buttons:
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", about_buttons[0])
+                    self._wait_until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, ABOUT_SECTION_SELECTOR)),
+                        "about section"
+                    )
+                    try:
+                        about_section = self.driver.find_element(By.CSS_SELECTOR, ABOUT_SECTION_SELECTOR)
+                        about_text = about_section.find_element(By.TAG_NAME, "span")
+                        profile_data['about'] = about_text.text.strip()[:ABOUT_MAX_LENGTH]
+                    except NoSuchElementException:
+                        logging.warning(f"Could not extract about section from {profile_url}")
+                        missing.append('about')
+
+        return missing
+
+    def _extract_fields_script(self, profile_data, profile_url, fields):
+        with self.metrics.span('field_script'):
+            page = self.driver.execute_async_script(
+                EXTRACT_PROFILE_SCRIPT,
+                HEADLINE_SELECTOR,
+                LOCATION_SELECTOR,
+                ABOUT_SECTION_SELECTOR,
+                int(self.wait_ceiling * 1000),
+                'about' in fields
+            )
+        missing = []
+
+        if 'name' in fields:
+            for name_text in page['h1']:
+                name_text = name_text.strip()
+                if is_valid_name(name_text):
+                    profile_data['name'] = name_text
+                    logging.info(f"Found name: {name_text}")
+                    break
+            if not profile_data['name']:
+                logging.warning(f"Could not extract name from {profile_url}")
+                missing.append('name')
+
+        if 'headline' in fields:
+            if page['headline'] is not None:
+                profile_data['headline'] = page['headline'].strip()
+            else:
                 logging.warning(f"Could not extract headline from {profile_url}")
+                missing.append('headline')
 
-            try:
-                location_element = self.driver.find_element(By.CSS_SELECTOR, "span.text-body-small.inline.t-black--light.break-words")
-                profile_data['location'] = location_element.text.strip()
-            except:
+        if 'location' in fields:
+            if page['location'] is not None:
+                profile_data['location'] = page['location'].strip()
+            else:
                 logging.warning(f"Could not extract location from {profile_url}")
+                missing.append('location')
 
-            try:
-                about_button = self.driver.find_element(By.ID, "about")
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", about_button)
-                time.sleep(1)
-                about_section = self.driver.find_element(By.CSS_SELECTOR, "section.artdeco-card div.display-flex.ph5.pv3")
-                about_text = about_section.find_element(By.TAG_NAME, "span")
-                profile_data['about'] = about_text.text.strip()[:500]
-            except:
+        if 'about' in fields and page['hasAbout']:
+            if page['about'] is not None:
+                profile_data['about'] = page['about'].strip()[:ABOUT_MAX_LENGTH]
+            else:
                 logging.warning(f"Could not extract about section from {profile_url}")
+                missing.append('about')
+
+        return missing
+
+    def _classify_page(self):
+        try:
+            return classify_page(*self.driver.execute_script(PAGE_STATE_SCRIPT))
+        except WebDriverException:
+            return None
+
+    def extract_profile_data(self, profile_url, fields=None):
+        fields = fields or self.fields
+        self.last_missing_fields = []
+        self.last_ready_timed_out = False
+        try:
+            logging.info(f"Scraping profile: {profile_url}")
+
+            with self.metrics.span('navigate'):
+                self.driver.get(profile_url)
+
+            with self.metrics.span('page_ready'):
+                self.last_ready_timed_out = not self.wait_for_profile_ready(fields)
+
+            # Only the about section is lazily rendered further down the page;
+            # the top card fields are there as soon as the page is ready
+            if 'about' in fields:
+                with self.metrics.span('scroll'):
+                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
+                    self._pause()
+
+            profile_data = empty_profile(profile_url)
+
+            if self.extraction_mode == 'script':
+                missing = self._extract_fields_script(profile_data, profile_url, fields)
+            else:
+                missing = self._extract_fields_webdriver(profile_data, profile_url, fields)
+
+            if 'name' in missing:
+                # No name usually means we landed on a checkpoint, 404 or restricted page
+                page_status = self._classify_page()
+                if page_status:
+                    logging.warning(f"{profile_url} is not scrapeable: {page_status}")
+                    return self._failed_profile(profile_url, page_status)
+            self.last_missing_fields = missing
+            if missing and not any(profile_data[field] for field in fields):
+                # Nothing rendered at all (an error page, a half-loaded shell):
+                # a transient failure, not a blank success
+                logging.warning(f"No profile data on {profile_url}")
+                return self._failed_profile(profile_url, 'error: empty profile page')
+
+            if self.snapshot_store:
+                try:
+                    with self.metrics.span('snapshot'):
+                        self.snapshot_store.put(profile_url, self.driver.page_source)
+                except Exception as e:
+                    logging.warning(f"Could not save snapshot of {profile_url}: {str(e)}")
 
             logging.info(f"Successfully scraped: {profile_data['name']}")
             return profile_data
 
         except TimeoutException:
             logging.error(f"Timeout while loading profile: {profile_url}")
-            return {
-                'profile_url': profile_url,
-                'name': '',
-                'headline': '',
-                'location': '',
-                'about': '',
-                'status': 'timeout'
-            }
+            self.metrics.increment('timeout', phase='profile')
+            return self._failed_profile(profile_url, self._classify_page() or 'timeout')
         except Exception as e:
             logging.error(f"Error scraping {profile_url}: {str(e)}")
-            return {
-                'profile_url': profile_url,
-                'name': '',
-                'headline': '',
-                'location': '',
-                'about': '',
-                'status': f'error: {str(e)}'
-            }
-
-    def scrape_profiles(self, profile_urls):
-        total = len(profile_urls)
+            return self._failed_profile(profile_url, f'error: {str(e)}')
+
+    def _pace(self):
+        # Shared with the other workers, so the account sees one combined pace
+        with self.metrics.span('profile_delay'):
+            waited = self.rate_controller.acquire(self._stop_requested)
+        if waited > 1:
+            logging.info(f"Waited {waited:.2f} seconds before next profile")
+
+    def _report_load(self, profile_data, load_seconds):
+        # Login redirects, checkpoints and pages without a name mean LinkedIn is pushing back
+        status = profile_data['status']
+        signal = None
+        if status.startswith('throttled') or 'name' in self.last_missing_fields:
+            signal = BLOCKED
+        elif status == 'timeout':
+            signal = SLOW
+        elif self.last_ready_timed_out:
+            # The wait ran to its ceiling on an element this profile lacks,
+            # which says nothing about how fast LinkedIn is answering
+            return
+        self.rate_controller.record(load_seconds, signal)
+
+    def _fetch_profile_http(self, profile_url):
+        try:
+            if self.http_fetcher is None:
+                self.http_fetcher = HttpProfileFetcher.from_driver(self.driver)
+
+            with self.metrics.span('http_fetch'):
+                page_html = self.http_fetcher.fetch(profile_url)
+            if page_html is None:
+                return None
+
+            with self.metrics.span('http_parse'):
+                profile_data, page_missing = parse_profile_page(page_html, profile_url)
+        except Exception as e:
+            logging.warning(f"HTTP fast path failed for {profile_url}: {str(e)}")
+            return None
+
+        # The browser only takes over for fields the page has but the HTML
+        # didn't fill in; a profile without an about section needs no visit
+        missing = [field for field in page_missing if field in self.fields]
+        if profile_data['status'] != 'success' or missing:
+            logging.info(f"HTTP fast path missing {', '.join(missing) or 'data'} for {profile_url}, falling back to browser")
+            return None
+
+        logging.info(f"Scraped via HTTP fast path: {profile_data['name']}")
+        with self._stats_lock:
+            self.fast_path_hits += 1
+        return profile_data
+
+    def _count_profile(self, profile_data):
+        status = profile_data['status'].split(':')[0]
+        self.metrics.increment('profiles', status=status)
+        if status == 'success':
+            for field in self.fields:
+                if not profile_data[field]:
+                    self.metrics.increment('missing_field', field=field)
+
+    def get_profile(self, profile_url, fields=None):
+        with log_context(url=profile_url):
+            return self._get_profile(profile_url, fields)
+
+    def _get_profile(self, profile_url, fields=None):
+        # fields narrows a re-visit to what an earlier attempt could not read
+        self.last_missing_fields = []
+        self.last_ready_timed_out = False
+        if fields:
+            self._pace()
+            started = time.monotonic()
+            with self.metrics.span('profile'):
+                profile_data = self.extract_profile_data(profile_url, fields)
+                self._after_page(profile_data)
+            self._report_load(profile_data, time.monotonic() - started)
+            return profile_data
+
+        if self.result_cache and not self.force_refresh:
+            cached = self.result_cache.get(profile_url, self.fields)
+            if cached is not None:
+                logging.info(f"Cache hit: {profile_url}")
+                with self._stats_lock:
+                    self.cache_hits += 1
+                self.metrics.increment('profiles', status='cached')
+                return cached
+
+        self._pace()
+        started = time.monotonic()
+        with self.metrics.span('profile'):
+            profile_data = None
+            if self.fast_path:
+                profile_data = self._fetch_profile_http(profile_url)
+            if profile_data is None:
+                profile_data = self.extract_profile_data(profile_url)
+                if self._after_page(profile_data):
+                    # The browser died under this profile; give it one more go on the fresh driver
+                    profile_data = self.extract_profile_data(profile_url)
+                    self._after_page(profile_data)
+        self._report_load(profile_data, time.monotonic() - started)
+        with self._stats_lock:
+            self.fresh_scrapes += 1
+        self._count_profile(profile_data)
+
+        # Partial profiles stay out of the cache so the next run visits them again
+        if self.result_cache and profile_data['status'] == 'success' and not self.last_missing_fields:
+            self.result_cache.put(profile_data, self.fields)
+        return profile_data
+
+    def _url_key(self, profile_url):
+        return normalize_profile_url(profile_url) or profile_url.strip()
+
+    def _notify_profile(self, profile_data, missing=None):
+        self.rate_controller.completed()
+        if self.change_tracker:
+            try:
+                change = self.change_tracker.observe(profile_data, self.fields, missing)
+                if change and self._change_writer:
+                    self._change_writer.write(change)
+                elif change:
+                    self.changes.append(change)
+            except Exception as e:
+                logging.warning(f"Change tracking failed for {profile_data['profile_url']}: {str(e)}")
+        if self._on_profile:
+            try:
+                self._on_profile(profile_data)
+            except Exception as e:
+                logging.warning(f"Progress callback failed: {str(e)}")
+
+    def _attempt(self, worker, item):
+        # Scrapes item.url, or only the fields an earlier attempt missed, and
+        # returns the profile to record; None means it went to the retry queue.
+        # item.missing_fields then lists what the returned profile still lacks
+        item.attempt += 1
+        try:
+            if item.missing_fields:
+                profile_data = dict(item.profile)
+                revisit = worker.get_profile(item.url, fields=item.missing_fields)
+                kind = classify_status(revisit['status'])
+                if kind is None:
+                    for field in item.missing_fields:
+                        if revisit[field]:
+                            profile_data[field] = revisit[field]
+                    missing = worker.last_missing_fields
+                    if worker.result_cache and not missing:
+                        worker.result_cache.put(profile_data, worker.fields)
+                    kind = PARTIAL if missing else None
+                else:
+                    missing = item.missing_fields
+            else:
+                profile_data = worker.get_profile(item.url)
+                missing = worker.last_missing_fields
+                kind = classify_status(profile_data['status']) or (PARTIAL if missing else None)
+        except Exception as e:
+            logging.error(f"Error scraping {item.url}: {str(e)}")
+            profile_data = item.profile or self._failed_profile(item.url, f'error: {str(e)}')
+            missing = item.missing_fields
+            kind = classify_status('error')
+
+        if kind is None:
+            item.missing_fields = None
+            return profile_data
+
+        item.kind = kind
+        item.profile = profile_data
+        item.missing_fields = missing if profile_data['status'] == 'success' else None
+        if self.retries.defer(item):
+            return None
+
+        if missing and profile_data['status'] == 'success':
+            logging.warning(f"Giving up on {', '.join(missing)} for {item.url}")
+        elif kind != PERMANENT:
+            logging.error(f"Giving up on {item.url} after {item.attempt} attempts ({profile_data['status']})")
+        return profile_data
+
+    def _deliver(self, item, profile_data, writer):
+        if writer:
+            writer.write(profile_data, self._url_key(profile_data['profile_url']))
+        else:
+            self.profiles_data[item.slot] = profile_data
+
+    def stop(self):
+        # Lets the current profile finish, then stops handing out new URLs
+        self._stop_requested.set()
+
+    @property
+    def stopped(self):
+        return self._stop_requested.is_set()
+
+    def _new_retry_scheduler(self):
+        return RetryScheduler(max_attempts=self.max_attempts, base_delay=self.retry_base_delay)
+
+    def scrape_profiles(self, profile_urls, workers=1, output=None, resume=False, on_profile=None,
+                        diff_output=None):
+        # Several browsers are driven from one event loop (see async_scraper);
+        # code that already runs an event loop calls scrape_profiles_async
+        if workers > 1:
+            asyncio.run(self.scrape_profiles_async(profile_urls, workers, output, resume, diff_output, on_profile))
+            return
+
+        writer, profile_urls = self._open_run(profile_urls, output, resume, on_profile, diff_output)
+        try:
+            self._scrape_profiles_sequential(profile_urls, writer)
+        finally:
+            self._close_run(writer, output, diff_output)
+
+    def iter_profiles_async(self, profile_urls, concurrency=2, output=None, resume=False, diff_output=None,
+                            on_profile=None):
+        # Async iterator of final profiles in completion order
+        return AsyncScraper(self, concurrency).iter_profiles(profile_urls, output, resume, diff_output, on_profile)
+
+    async def scrape_profiles_async(self, profile_urls, concurrency=2, output=None, resume=False,
+                                    diff_output=None, on_profile=None):
+        return await AsyncScraper(self, concurrency).scrape_profiles(
+            profile_urls, output, resume, diff_output, on_profile
+        )
+
+    def _open_run(self, profile_urls, output, resume, on_profile, diff_output):
+        # With a change tracker, new/changed/disappeared profiles are also
+        # reported on their own: streamed to diff_output, or kept in self.changes
+        self._on_profile = on_profile
+        self.retries = self._new_retry_scheduler()
+        self.changes = []
+        if self.change_tracker and diff_output:
+            self._change_writer = ChangeWriter(diff_output, self.fields, resume=resume)
+        writer = None
+        if output:
+            writer = CheckpointWriter(output, self.fieldnames, resume=resume)
+            if resume and writer.completed_urls:
+                logging.info(f"Resuming: skipping {len(writer.completed_urls)} profiles already saved to {output}")
+                completed = writer.completed_urls
+                profile_urls = (url for url in profile_urls if self._url_key(url) not in completed)
+        return writer, profile_urls
+
+    def _close_run(self, writer, output, diff_output):
+        if writer:
+            writer.close()
+            logging.info(f"Data saved to {output}")
+        if self._change_writer:
+            self._change_writer.close()
+            self._change_writer = None
+            logging.info(f"Changes saved to {diff_output}")
+
+    def _scrape_profiles_sequential(self, profile_urls, writer):
+        total = len(profile_urls) if hasattr(profile_urls, '__len__') else '?'
         success_count = 0
+        idx = 0
+        pending_urls = enumerate(profile_urls, 1)
 
-        for idx, url in enumerate(profile_urls, 1):
-            logging.info(f"Processing profile {idx}/{total}")
+        # Fresh URLs and due retries share the loop, so a failing profile
+        # waits out its backoff without holding up the rest of the list
+        while not self.stopped:
+            self.retries.wait_cooldown(self._stop_requested)
+            item = self.retries.pop_due()
+            if item is None:
+                next_url = next(pending_urls, None)
+                if next_url is None:
+                    if not len(self.retries):
+                        break
+                    self.retries.wait(self._stop_requested)
+                    continue
 
-            if idx > 1:
-                delay = random.uniform(5, 10)
-                logging.info(f"Waiting {delay:.2f} seconds before next profile...")
-                time.sleep(delay)
+                idx, url = next_url
+                logging.info(f"Processing profile {idx}/{total}")
+                item = RetryItem(url, len(self.profiles_data))
+                if not writer:
+                    self.profiles_data.append(None)
 
-            profile_data = self.extract_profile_data(url)
-            self.profiles_data.append(profile_data)
+            profile_data = self._attempt(self, item)
+            if profile_data is None:
+                continue
+            self._deliver(item, profile_data, writer)
+            self._notify_profile(profile_data, item.missing_fields)
 
             if profile_data['status'] == 'success':
                 success_count += 1
 
-        logging.info(f"Scraping completed: {success_count}/{total} profiles successful")
+        for item in self._deferred_results(writer):
+            self._deliver(item, item.profile, writer)
+            self._notify_profile(item.profile, item.missing_fields)
+        if not writer:
+            self.profiles_data[:] = [profile for profile in self.profiles_data if profile is not None]
+        self._log_run_summary(success_count, idx)
+
+    def _deferred_results(self, writer):
+        # Retries still waiting when the run stops: in-memory runs record the
+        # last result like any other, streaming runs leave them out so a
+        # resumed run picks them up
+        for item in self.retries.drain():
+            if not writer and item.profile:
+                yield item
+
+    def _log_run_summary(self, success_count, count):
+        if self.stopped:
+            logging.info("Scraping stopped on request")
+        logging.info(f"Scraping completed: {success_count}/{count} profiles successful")
+        logging.info(f"Cache hits: {self.cache_hits}, fresh scrapes: {self.fresh_scrapes}")
+
+    def _worker_session(self):
+        # Handed to the other browsers so they don't each go through the
+        # credential login
+        if not self.driver:
+            return None
+        try:
+            return self.export_session()
+        except Exception as e:
+            logging.warning(f"Could not export session for workers: {str(e)}")
+            return None
+
+    def _spawn_worker(self, worker_id, session):
+        worker = type(self)(self.email, self.password, **self._worker_options())
+        # Workers stop with the scraper that spawned them
+        worker._stop_requested = self._stop_requested
+        try:
+            worker.setup_driver()
+            if worker.login(session=session):
+                return worker
+            logging.error(f"Worker {worker_id} failed to log in")
+        except Exception as e:
+            logging.error(f"Worker {worker_id} failed to start: {str(e)}")
+        worker.close()
+        return None
+
+    def _merge_worker_stats(self, worker):
+        with self._stats_lock:
+            self.cache_hits += worker.cache_hits
+            self.fresh_scrapes += worker.fresh_scrapes
+            self.fast_path_hits += worker.fast_path_hits
+            self.drivers_recycled += worker.drivers_recycled
+
+    def scrape_queue(self, work_queue, workers=1, worker_id=None, lease_seconds=120, poll_interval=5,
+                     on_profile=None):
+        # Multi-node mode: URLs are claimed from a shared work queue and the
+        # results written back to it, so any number of processes on any
+        # number of machines can drain the same queue
+        self._on_profile = on_profile
+        self.retries = self._new_retry_scheduler()
+        worker_id = worker_id or default_worker_id()
+        counts = {'claimed': 0, 'success': 0}
+
+        session = self._worker_session() if workers > 1 else None
+
+        logging.info(f"Draining work queue with {workers} browser(s) as {worker_id}")
+        threads = []
+        for idx in range(1, workers + 1):
+            thread = threading.Thread(
+                target=self._queue_worker,
+                args=(idx, work_queue, f'{worker_id}-{idx}', lease_seconds, poll_interval, session, counts),
+                name=f"{threading.current_thread().name}-worker-{idx}",
+                daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        logging.info(f"Queue worker finished: {counts['success']}/{counts['claimed']} profiles successful")
+        logging.info(f"Cache hits: {self.cache_hits}, fresh scrapes: {self.fresh_scrapes}")
 
+    def _queue_worker(self, idx, work_queue, worker_id, lease_seconds, poll_interval, session, counts):
+        set_log_context(worker=worker_id)
+        worker = self if idx == 1 else self._spawn_worker(idx, session)
+        if worker is None:
+            return
+
+        try:
+            while not self.stopped:
+                urls = work_queue.claim(worker_id, lease_seconds)
+                if not urls:
+                    if not work_queue.pending():
+                        break
+                    # Other workers still hold leases; wait in case one of them expires
+                    self._stop_requested.wait(poll_interval)
+                    continue
+
+                url = urls[0]
+                if self.stopped:
+                    # Stopped while claiming; hand it back without spending an attempt
+                    work_queue.release(worker_id, url)
+                    break
+                with self._stats_lock:
+                    counts['claimed'] += 1
+                logging.info(f"[{worker_id}] Claimed {url}")
+
+                missing = []
+                try:
+                    with LeaseHeartbeat(work_queue, worker_id, url, lease_seconds) as heartbeat:
+                        profile_data = worker.get_profile(url)
+                        missing = worker.last_missing_fields
+                except Exception as e:
+                    logging.error(f"[{worker_id}] Error scraping {url}: {str(e)}")
+                    profile_data = self._failed_profile(url, f'error: {str(e)}')
+
+                if heartbeat.lost:
+                    logging.warning(f"[{worker_id}] Lease on {url} expired before the result was saved")
+                    continue
+
+                # Failed and partial URLs go back to the shared queue after a
+                # backoff, so any node can pick up the retry; once attempts
+                # run out the last result is saved as it is
+                kind = classify_status(profile_data['status']) or (PARTIAL if missing else None)
+                if kind is not None and kind != PERMANENT:
+                    delay = self.retries.backoff(kind, work_queue.attempts(url))
+                    if work_queue.defer(worker_id, url, delay):
+                        logging.info(f"[{worker_id}] Retrying {url} ({kind}) in {delay:.0f}s")
+                        if kind == THROTTLED:
+                            self._stop_requested.wait(delay)
+                        continue
+
+                if not work_queue.complete(worker_id, url, profile_data):
+                    logging.warning(f"[{worker_id}] Lease on {url} expired before the result was saved")
+                    continue
+
+                if profile_data['status'] == 'success':
+                    with self._stats_lock:
+                        counts['success'] += 1
+                self._notify_profile(profile_data, missing)
+        finally:
+            if worker is not self:
+                self._merge_worker_stats(worker)
+                worker.close()
+
+    @timed('save_to_csv')
     def save_to_csv(self, filename='linkedin_profiles.csv'):
         if not self.profiles_data:
             logging.warning("No data to save")
@@ -191,12 +1008,7 @@ class LinkedInScraper:
 
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['profile_url', 'name', 'headline', 'location', 'about', 'status']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-                for profile in self.profiles_data:
-                    writer.writerow(profile)
+                write_csv(self.profiles_data, csvfile, self.fieldnames)
 
             logging.info(f"Data saved to {filename}")
             print(f"\n✓ Successfully saved {len(self.profiles_data)} profiles to {filename}")
@@ -205,20 +1017,49 @@ class LinkedInScraper:
             logging.error(f"Error saving to CSV: {str(e)}")
 
     def close(self):
+        if self.http_fetcher:
+            self.http_fetcher.close()
+            self.http_fetcher = None
+        if self.driver_manager:
+            self.driver_manager.close()
         if self.driver:
             self.driver.quit()
             logging.info("Browser closed")
 
 
+def prewarm_browser(lightweight=False, base_url=LINKEDIN_URL, wait_ceiling=15):
+    # Launches Chrome and opens the login page in the background so the
+    # launch overlaps with whatever happens before scraping starts (prompts,
+    # form filling); pass the result to LinkedInScraper(driver_manager=...)
+    launcher = LinkedInScraper(None, None, lightweight=lightweight, base_url=base_url, wait_ceiling=wait_ceiling)
+    driver_manager = DriverManager(launcher._create_driver, prewarm=1, warm_url=f'{base_url}/login')
+    driver_manager.start()
+    return driver_manager
+
+
+async def print_as_completed(scraper, profile_urls, concurrency, output, resume, diff_output):
+    async for profile_data in scraper.iter_profiles_async(profile_urls, concurrency, output, resume, diff_output):
+        mark = '✓' if profile_data['status'] == 'success' else '✗'
+        print(f"  {mark} {profile_data['name'] or profile_data['profile_url']} ({profile_data['status']})")
+
+
 def main():
+    configure_logging()
 
     print("=" * 60)
     print("LinkedIn Profile Scraper")
     print("=" * 60)
 
+    # Asked first so Chrome can start while the remaining questions are answered
+    lightweight = input("\nRun headless with images/fonts/media/trackers blocked? (y/n): ").strip().lower() == 'y'
+    warm_browser = prewarm_browser(lightweight=lightweight)
+    atexit.register(warm_browser.close)
+
     email = input("\nEnter your LinkedIn email: ").strip()
     password = input("Enter your LinkedIn password: ").strip()
 
+    url_stats = {}
+
     profile_urls = [
         "https://www.linkedin.com/in/satyanadella/",
         "https://www.linkedin.com/in/sundar-pichai-4b2ba418b/",
@@ -230,16 +1071,62 @@ def main():
     load_from_file = input("\nLoad profile URLs from file? (y/n): ").strip().lower()
     if load_from_file == 'y':
         filename = input("Enter filename (e.g., urls.txt): ").strip()
-        try:
-            with open(filename, 'r') as f:
-                profile_urls = [line.strip() for line in f if line.strip()]
-            print(f"Loaded {len(profile_urls)} URLs from {filename}")
-        except FileNotFoundError:
+        if os.path.exists(filename):
+            profile_urls = read_profile_urls(filename, url_stats)
+            print(f"Streaming URLs from {filename}")
+        else:
             print(f"File {filename} not found. Using default URLs.")
 
-    print(f"\nPreparing to scrape {len(profile_urls)} profiles...")
+    if isinstance(profile_urls, list):
+        profile_urls = list(iter_profile_urls(profile_urls, url_stats))
+
+    workers = input("Number of parallel browsers (default 1): ").strip()
+    workers = int(workers) if workers.isdigit() and int(workers) > 0 else 1
+
+    force_refresh = input("Ignore cached results and re-scrape every profile? (y/n): ").strip().lower() == 'y'
 
-    scraper = LinkedInScraper(email, password)
+    fast_path = input("Try a fast HTTP fetch before opening each profile in Chrome? (y/n): ").strip().lower() == 'y'
+    save_snapshots = input("Save compressed page snapshots for offline re-parsing? (y/n): ").strip().lower() == 'y'
+
+    fields = input(f"Fields to collect, comma separated (default all: {', '.join(PROFILE_FIELDS)}): ").strip()
+    fields = [field.strip().lower() for field in fields.split(',') if field.strip()]
+    try:
+        fields = select_fields(fields)
+    except ValueError as e:
+        print(f"{e}. Collecting all fields.")
+        fields = PROFILE_FIELDS
+
+    recycle_after = input("Restart each browser after how many profiles? (default 200, 0 = never): ").strip()
+    recycle_after = int(recycle_after) if recycle_after.isdigit() else 200
+
+    track_changes = input("Also write only the profiles that changed since the last run? (y/n): ").strip().lower() == 'y'
+    change_tracker = ChangeTracker() if track_changes else None
+
+    output_file = 'linkedin_profiles.csv'
+    changes_file = 'linkedin_profile_changes.csv'
+    resume = False
+    if os.path.exists(f'{output_file}.journal'):
+        resume = input(f"Resume previous run saved in {output_file}? (y/n): ").strip().lower() == 'y'
+
+    print(f"\nPreparing to scrape profiles with {workers} browser(s)...")
+
+    result_cache = ResultCache()
+    scraper = LinkedInScraper(
+        email,
+        password,
+        lightweight=lightweight,
+        session_store=SessionStore(),
+        result_cache=result_cache,
+        force_refresh=force_refresh,
+        snapshot_store=SnapshotStore() if save_snapshots else None,
+        fast_path=fast_path,
+        recycle_after_pages=recycle_after or None,
+        max_driver_rss_mb=1500,
+        prewarm_drivers=1 if recycle_after else 0,
+        fields=fields,
+        change_tracker=change_tracker,
+        driver_manager=warm_browser
+    )
 
     try:
         scraper.setup_driver()
@@ -250,9 +1137,29 @@ def main():
 
         print("\n✓ Login successful! Starting to scrape profiles...\n")
 
-        scraper.scrape_profiles(profile_urls)
+        diff_output = changes_file if change_tracker else None
+        if workers > 1:
+            asyncio.run(print_as_completed(scraper, profile_urls, workers, output_file, resume, diff_output))
+        else:
+            scraper.scrape_profiles(profile_urls, workers=workers, output=output_file, resume=resume,
+                                    diff_output=diff_output)
+
+        print(f"\n✓ Results saved to {output_file}")
+        if change_tracker:
+            counts = change_tracker.counts
+            print(f"  Changes saved to {changes_file}: {counts['new']} new, {counts['changed']} changed, "
+                  f"{counts['disappeared']} disappeared ({counts['unchanged']} unchanged)")
+        print(f"  Cache hits: {scraper.cache_hits} | Fresh scrapes: {scraper.fresh_scrapes} "
+              f"(via HTTP fast path: {scraper.fast_path_hits})")
+        print(f"  Browser restarts: {scraper.drivers_recycled} | "
+              f"Final pace: {scraper.rate_controller.per_minute:.1f} profiles/min")
+        print(f"  Unique URLs: {url_stats['accepted']} | Duplicates dropped: {url_stats['duplicates']} | "
+              f"Invalid lines dropped: {url_stats['rejected']}")
 
-        scraper.save_to_csv()
+        print("\n  Time per phase (mean / p95 / total):")
+        for phase, timing in scraper.metrics.summary()['phases'].items():
+            print(f"    {phase:<16} {timing['mean_seconds']:>7.2f}s {timing['p95_seconds']:>7.2f}s "
+                  f"{timing['total_seconds']:>9.1f}s  ({timing['count']}x)")
 
         print("\n" + "=" * 60)
         print("Scraping completed successfully!")
@@ -260,13 +1167,111 @@ def main():
 
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user")
-        scraper.save_to_csv('linkedin_profiles_partial.csv')
+        print(f"Completed profiles are saved in {output_file}; answer 'y' to resume next time.")
     except Exception as e:
         logging.error(f"An error occurred: {str(e)}")
         print(f"\n✗ Error: {str(e)}")
     finally:
         scraper.close()
+        result_cache.close()
+        if change_tracker:
+            change_tracker.close()
+        scraper.metrics.write_json('scraper_metrics.json')
+        scraper.metrics.write_prometheus('scraper_metrics.prom')
+
+
+def queue_main(argv):
+    parser = argparse.ArgumentParser(
+        prog='linkedin_scraper.py',
+        description="Scale scraping across machines through a shared work queue"
+    )
+    parser.add_argument('--queue', default=os.environ.get('LINKEDIN_WORK_QUEUE', 'work_queue.db'),
+                        help="Queue location: a SQLite path or sqlite:///path; to share it between "
+                             "machines, put it on a volume with working cross-host file locks")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    enqueue = commands.add_parser('enqueue', help="Add the profile URLs in a file to the queue")
+    enqueue.add_argument('file')
+
+    work = commands.add_parser('work', help="Claim and scrape URLs until the queue is drained")
+    work.add_argument('--workers', type=int, default=1, help="Browsers on this node")
+    work.add_argument('--worker-id', help="Defaults to <hostname>-<pid>")
+    work.add_argument('--lease', type=float, default=120, help="Lease length in seconds")
+    work.add_argument('--poll-interval', type=float, default=5)
+    work.add_argument('--lightweight', action='store_true')
+    work.add_argument('--fast-path', action='store_true')
+    work.add_argument('--force-refresh', action='store_true')
+    work.add_argument('--fields', nargs='+', choices=PROFILE_FIELDS, help="Only collect these fields")
+
+    commands.add_parser('status', help="Show how many URLs are in each state")
+
+    export = commands.add_parser('export', help="Write finished results to CSV")
+    export.add_argument('--output', default='linkedin_profiles.csv')
+    export.add_argument('--fields', nargs='+', choices=PROFILE_FIELDS, help="Only write these fields")
+
+    args = parser.parse_args(argv)
+    configure_logging()
+    work_queue = open_work_queue(args.queue)
+
+    try:
+        if args.command == 'enqueue':
+            url_stats = {}
+            added = work_queue.enqueue(read_profile_urls(args.file, url_stats))
+            print(f"Queued {added} URLs from {args.file} ({url_stats['duplicates']} duplicates, "
+                  f"{url_stats['rejected']} invalid lines dropped)")
+
+        elif args.command == 'status':
+            # Leases of crashed workers would otherwise still show as leased
+            work_queue.requeue_expired()
+            for state, count in sorted(work_queue.counts().items()):
+                print(f"{state:<8} {count}")
+
+        elif args.command == 'export':
+            with open(args.output, 'w', newline='', encoding='utf-8') as f:
+                count = write_csv(work_queue.iter_results(), f, fieldnames_for(args.fields))
+            print(f"Wrote {count} results to {args.output}")
+
+        else:
+            email = os.environ.get('LINKEDIN_EMAIL') or input("LinkedIn email: ").strip()
+            password = os.environ.get('LINKEDIN_PASSWORD') or getpass.getpass("LinkedIn password: ")
+
+            result_cache = ResultCache()
+            scraper = LinkedInScraper(
+                email,
+                password,
+                lightweight=args.lightweight,
+                session_store=SessionStore(),
+                result_cache=result_cache,
+                force_refresh=args.force_refresh,
+                fast_path=args.fast_path,
+                recycle_after_pages=200,
+                max_driver_rss_mb=1500,
+                prewarm_drivers=1,
+                fields=args.fields
+            )
+            try:
+                scraper.setup_driver()
+                if not scraper.login():
+                    print("Login failed. Please check your credentials.")
+                    sys.exit(1)
+                scraper.scrape_queue(
+                    work_queue,
+                    workers=args.workers,
+                    worker_id=args.worker_id,
+                    lease_seconds=args.lease,
+                    poll_interval=args.poll_interval
+                )
+            except KeyboardInterrupt:
+                print("Interrupted; unfinished leases will expire and be picked up by other workers")
+            finally:
+                scraper.close()
+                result_cache.close()
+    finally:
+        work_queue.close()
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        queue_main(sys.argv[1:])
+    else:
+        main()
@@ -0,0 +1,133 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+from contextlib import contextmanager
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Per-thread fields stamped onto every record logged from that thread
+CONTEXT_FIELDS = ('url', 'worker', 'phase')
+
+_context = threading.local()
+_listener = None
+_queue_handler = None
+_lock = threading.Lock()
+
+
+def set_log_context(**fields):
+    for name, value in fields.items():
+        setattr(_context, name, value)
+
+
+@contextmanager
+def log_context(**fields):
+    previous = {name: getattr(_context, name, None) for name in fields}
+    set_log_context(**fields)
+    try:
+        yield
+    finally:
+        set_log_context(**previous)
+
+
+class ContextFilter(logging.Filter):
+    # Runs on the logging thread, where the thread-local context is visible
+
+    def filter(self, record):
+        for name in CONTEXT_FIELDS:
+            if getattr(record, name, None) is None:
+                setattr(record, name, getattr(_context, name, None))
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        for name in CONTEXT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def configure_logging(level=logging.INFO, log_file='scraper.log', console=True,
+                      max_bytes=10 * 1024 * 1024, backup_count=5):
+    # Threads only put records on an in-memory queue; a single listener
+    # thread formats them and does the console and (rotated) file I/O.
+    # Safe to call more than once: later calls just adjust the level.
+    global _listener, _queue_handler
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        handlers = []
+        if log_file:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            handlers.append(console_handler)
+
+        log_queue = queue.SimpleQueue()
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        _queue_handler.addFilter(ContextFilter())
+        root.addHandler(_queue_handler)
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging():
+    # Flushes whatever is still queued
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is None:
+            return
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        _queue_handler = None
+
+
+def attach_handler(handler):
+    # Extra sinks (e.g. a job's log view) hang off the listener thread, so
+    # they add nothing to the scraping threads; without a pipeline they fall
+    # back to the root logger
+    with _lock:
+        if _listener is None:
+            logging.getLogger().addHandler(handler)
+            return
+        _listener.handlers = _listener.handlers + (handler,)
+
+
+def detach_handler(handler):
+    with _lock:
+        if _listener is None:
+            logging.getLogger().removeHandler(handler)
+            return
+        _listener.handlers = tuple(h for h in _listener.handlers if h is not handler)
@@ -0,0 +1,165 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from log_pipeline import log_context
+
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+METRIC_PREFIX = 'linkedin_scraper'
+
+
+class Histogram:
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[idx] += 1
+                break
+
+    def quantile(self, q):
+        # Upper bound of the bucket holding the q-th observation
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+
+class ScraperMetrics:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+
+    def observe(self, phase, seconds):
+        with self._lock:
+            histogram = self._histograms.get(phase)
+            if histogram is None:
+                histogram = self._histograms[phase] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def span(self, phase):
+        start = time.perf_counter()
+        try:
+            with log_context(phase=phase):
+                yield
+        finally:
+            self.observe(phase, time.perf_counter() - start)
+
+    def increment(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def summary(self):
+        with self._lock:
+            phases = {
+                phase: {
+                    'count': histogram.count,
+                    'total_seconds': round(histogram.sum, 3),
+                    'mean_seconds': round(histogram.sum / histogram.count, 3) if histogram.count else 0.0,
+                    'p50_seconds': round(histogram.quantile(0.5), 3),
+                    'p95_seconds': round(histogram.quantile(0.95), 3),
+                    'max_seconds': round(histogram.max, 3),
+                }
+                for phase, histogram in sorted(self._histograms.items())
+            }
+            counters = {}
+            for (name, labels), value in sorted(self._counters.items()):
+                label_text = ','.join(f'{key}={label}' for key, label in labels)
+                counters[f'{name}{{{label_text}}}' if label_text else name] = value
+        return {'phases': phases, 'counters': counters}
+
+    def to_prometheus(self):
+        lines = [
+            f'# HELP {METRIC_PREFIX}_phase_seconds Time spent in each scraper phase',
+            f'# TYPE {METRIC_PREFIX}_phase_seconds histogram',
+        ]
+        with self._lock:
+            for phase, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.bucket_counts):
+                    cumulative += bucket_count
+                    lines.append(f'{METRIC_PREFIX}_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {cumulative}')
+                lines.append(f'{METRIC_PREFIX}_phase_seconds_bucket{{phase="{phase}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{METRIC_PREFIX}_phase_seconds_sum{{phase="{phase}"}} {histogram.sum:.6f}')
+                lines.append(f'{METRIC_PREFIX}_phase_seconds_count{{phase="{phase}"}} {histogram.count}')
+
+            declared = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in declared:
+                    lines.append(f'# TYPE {METRIC_PREFIX}_{name}_total counter')
+                    declared.add(name)
+                label_text = ','.join(f'{key}="{label}"' for key, label in labels)
+                lines.append(f'{METRIC_PREFIX}_{name}_total{{{label_text}}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path):
+        self._write(path, json.dumps(self.summary(), indent=2))
+
+    def write_prometheus(self, path):
+        self._write(path, self.to_prometheus())
+
+    def _write(self, path, text):
+        # Atomic replace so a scraping node_exporter textfile collector never
+        # reads a half-written file
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def serve(self, port=9464, host='0.0.0.0'):
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith('/metrics.json'):
+                    body, content_type = json.dumps(metrics.summary()), 'application/json'
+                else:
+                    body, content_type = metrics.to_prometheus(), 'text/plain; version=0.0.4'
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+        return server
+
+
+def timed(phase):
+    # Records the decorated method's duration on self.metrics
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.span(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,46 @@
+import os
+
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def read_proc_stats():
+    # pid -> (ppid, cpu seconds, rss bytes) for every process, read from /proc
+    stats = {}
+    if not os.path.isdir('/proc'):
+        return stats
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f'/proc/{pid}/stat', 'r') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        ppid = int(fields[1])
+        cpu = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+        rss = int(fields[21]) * PAGE_SIZE
+        stats[int(pid)] = (ppid, cpu, rss)
+    return stats
+
+
+def descendants(stats, root_pid):
+    children = {}
+    for pid, (ppid, _, _) in stats.items():
+        children.setdefault(ppid, []).append(pid)
+
+    found = []
+    pending = list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        found.append(pid)
+        pending.extend(children.get(pid, []))
+    return found
+
+
+def process_tree_rss(root_pid):
+    # RSS in bytes of root_pid and everything below it; 0 when /proc is unavailable
+    stats = read_proc_stats()
+    if root_pid not in stats:
+        return 0
+    return sum(stats[pid][2] for pid in [root_pid] + descendants(stats, root_pid))
@@ -0,0 +1,34 @@
+PROFILE_FIELDNAMES = ['profile_url', 'name', 'headline', 'location', 'about', 'status']
+
+# The fields a scrape can be narrowed to; profile_url and status are always kept
+PROFILE_FIELDS = ('name', 'headline', 'location', 'about')
+
+HEADLINE_SELECTOR = "div.text-body-medium"
+LOCATION_SELECTOR = "span.text-body-small.inline.t-black--light.break-words"
+ABOUT_SECTION_SELECTOR = "section.artdeco-card div.display-flex.ph5.pv3"
+
+ABOUT_MAX_LENGTH = 500
+
+
+def select_fields(fields=None):
+    # Requested fields in canonical order; None means all of them
+    if not fields:
+        return PROFILE_FIELDS
+    unknown = set(fields) - set(PROFILE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown profile fields: {', '.join(sorted(unknown))}")
+    return tuple(field for field in PROFILE_FIELDS if field in fields)
+
+
+def fieldnames_for(fields):
+    return ['profile_url'] + list(select_fields(fields)) + ['status']
+
+
+def empty_profile(profile_url, status='success'):
+    # A record with every field blank, for the extractors to fill in or to
+    # report a page that yielded nothing
+    return {'profile_url': profile_url, **{field: '' for field in PROFILE_FIELDS}, 'status': status}
+
+
+def is_valid_name(name_text):
+    return bool(name_text) and 2 <= len(name_text) <= 100 and not name_text.startswith('http')
@@ -0,0 +1,192 @@
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import html as lxml_html
+
+from exporters import write_csv
+from profile_fields import ABOUT_MAX_LENGTH, empty_profile, is_valid_name
+from snapshot_store import SnapshotStore
+
+
+def _has_classes(*classes):
+    return ' and '.join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')"
+        for css_class in classes
+    )
+
+
+# XPath equivalents of the CSS selectors in profile_fields, so parsing only
+# needs lxml and not the optional cssselect package
+H1_XPATH = '//h1'
+HEADLINE_XPATH = f"//div[{_has_classes('text-body-medium')}]"
+LOCATION_XPATH = f"//span[{_has_classes('text-body-small', 'inline', 't-black--light', 'break-words')}]"
+ABOUT_ANCHOR_XPATH = "//*[@id='about']"
+JSON_LD_XPATH = "//script[@type='application/ld+json']"
+CODE_PAYLOAD_XPATH = '//code'
+ABOUT_SPAN_XPATH = (
+    f"(//section[{_has_classes('artdeco-card')}]"
+    f"//div[{_has_classes('display-flex', 'ph5', 'pv3')}])[1]//span"
+)
+
+
+def _text(element):
+    return ' '.join(element.text_content().split())
+
+
+def _first_text(tree, xpath):
+    elements = tree.xpath(xpath)
+    return _text(elements[0]) if elements else None
+
+
+def _json_ld_fields(tree):
+    # Public profile pages embed a schema.org Person
+    for script in tree.xpath(JSON_LD_XPATH):
+        try:
+            payload = json.loads(script.text_content())
+        except ValueError:
+            continue
+
+        items = payload.get('@graph', [payload]) if isinstance(payload, dict) else payload
+        for item in items:
+            if not isinstance(item, dict) or item.get('@type') != 'Person':
+                continue
+
+            job_title = item.get('jobTitle') or ''
+            if isinstance(job_title, list):
+                job_title = ', '.join(job_title)
+
+            address = item.get('address') or {}
+            location = address.get('addressLocality') or '' if isinstance(address, dict) else ''
+
+            return {
+                'name': item.get('name') or '',
+                'headline': job_title,
+                'location': location,
+                'about': item.get('description') or '',
+            }
+    return {}
+
+
+def _code_payload_fields(tree):
+    # Logged-in pages ship voyager API responses inside <code> elements; the
+    # profile entity is the one carrying firstName/lastName/headline
+    for code in tree.xpath(CODE_PAYLOAD_XPATH):
+        text = code.text_content().strip()
+        if not text.startswith('{'):
+            continue
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            continue
+
+        for item in payload.get('included', []) if isinstance(payload, dict) else []:
+            if not isinstance(item, dict) or 'firstName' not in item or 'headline' not in item:
+                continue
+            name = f"{item.get('firstName') or ''} {item.get('lastName') or ''}".strip()
+            location = item.get('locationName') or item.get('geoLocationName') or ''
+            return {
+                'name': name,
+                'headline': item.get('headline') or '',
+                'location': location,
+                'about': item.get('summary') or '',
+            }
+    return {}
+
+
+def parse_profile_html(page_html, profile_url):
+    return parse_profile_page(page_html, profile_url)[0]
+
+
+def parse_profile_page(page_html, profile_url):
+    # Also returns the fields the page should have had but that came out
+    # empty: the top card always, about only when the section is there
+    profile_data = empty_profile(profile_url)
+
+    try:
+        tree = lxml_html.fromstring(page_html)
+    except Exception as e:
+        profile_data['status'] = f'error: {str(e)}'
+        return profile_data, []
+
+    for h1 in tree.xpath(H1_XPATH):
+        name_text = _text(h1)
+        if is_valid_name(name_text):
+            profile_data['name'] = name_text
+            break
+
+    profile_data['headline'] = _first_text(tree, HEADLINE_XPATH) or ''
+    profile_data['location'] = _first_text(tree, LOCATION_XPATH) or ''
+
+    has_about = bool(tree.xpath(ABOUT_ANCHOR_XPATH))
+    if has_about:
+        about_spans = tree.xpath(ABOUT_SPAN_XPATH)
+        if about_spans:
+            profile_data['about'] = about_spans[0].text_content().strip()[:ABOUT_MAX_LENGTH]
+
+    # Fall back to the embedded JSON for anything the markup didn't render
+    if not all(profile_data[field] for field in ('name', 'headline', 'location', 'about')):
+        for embedded in (_code_payload_fields(tree), _json_ld_fields(tree)):
+            for field, value in embedded.items():
+                value = ' '.join(value.split()) if field != 'about' else value.strip()[:ABOUT_MAX_LENGTH]
+                if field == 'name' and not is_valid_name(value):
+                    continue
+                if not profile_data[field] and value:
+                    profile_data[field] = value
+
+    missing = [field for field in ('name', 'headline', 'location') if not profile_data[field]]
+    if has_about and not profile_data['about']:
+        missing.append('about')
+    return profile_data, missing
+
+
+# Each parser process opens the snapshot store once, in _init_parser
+_snapshot_store = None
+
+
+def _init_parser(directory):
+    global _snapshot_store
+    _snapshot_store = SnapshotStore(directory)
+
+
+def _parse_snapshot(task):
+    profile_url, digest = task
+    try:
+        return parse_profile_html(_snapshot_store.get(digest), profile_url)
+    except Exception as e:
+        return empty_profile(profile_url, f'error: {str(e)}')
+
+
+def parse_snapshots(directory, output, processes=None, chunksize=64):
+    store = SnapshotStore(directory)
+    tasks = [(entry['profile_url'], entry['sha256']) for entry in store.latest()]
+
+    start = time.perf_counter()
+    with open(output, 'w', newline='', encoding='utf-8') as csvfile:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_parser,
+                                 initargs=(directory,)) as executor:
+            count = write_csv(executor.map(_parse_snapshot, tasks, chunksize=chunksize), csvfile)
+
+    elapsed = time.perf_counter() - start
+    logging.info(f"Parsed {count} snapshots into {output} in {elapsed:.1f}s")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract profile fields from saved page snapshots")
+    parser.add_argument('--snapshots', default='snapshots', help="Snapshot store directory")
+    parser.add_argument('--output', default='linkedin_profiles_offline.csv', help="CSV file to write")
+    parser.add_argument('--processes', type=int, default=os.cpu_count(), help="Parser processes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    count = parse_snapshots(args.snapshots, args.output, processes=args.processes)
+    print(f"✓ Parsed {count} snapshots into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
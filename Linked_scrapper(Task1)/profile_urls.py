@@ -0,0 +1,66 @@
+import hashlib
+import re
+from urllib.parse import unquote, urlsplit
+
+PROFILE_PATH_RE = re.compile(r'^/in/([^/?#]+)')
+
+
+def normalize_profile_url(url):
+    url = url.strip()
+    if not url:
+        return None
+    if '://' not in url:
+        url = f'https://{url}'
+
+    parts = urlsplit(url)
+    host = parts.netloc.lower().split(':')[0]
+    # Locale subdomains (uk.linkedin.com, de.linkedin.com, ...) serve the same profile
+    if host != 'linkedin.com' and not host.endswith('.linkedin.com'):
+        return None
+
+    match = PROFILE_PATH_RE.match(parts.path)
+    if not match:
+        return None
+
+    slug = unquote(match.group(1)).strip().lower()
+    if not slug:
+        return None
+    return f'https://www.linkedin.com/in/{slug}/'
+
+
+def iter_profile_urls(lines, stats=None):
+    # Yields canonical profile URLs lazily, dropping duplicates and anything
+    # that isn't a profile. The seen-set holds 8-byte digests rather than the
+    # URLs themselves, which keeps multi-million-line inputs small in memory.
+    if stats is None:
+        stats = {}
+    stats.setdefault('accepted', 0)
+    stats.setdefault('duplicates', 0)
+    stats.setdefault('rejected', 0)
+
+    seen = set()
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='ignore')
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        url = normalize_profile_url(line)
+        if url is None:
+            stats['rejected'] += 1
+            continue
+
+        key = int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+        if key in seen:
+            stats['duplicates'] += 1
+            continue
+        seen.add(key)
+
+        stats['accepted'] += 1
+        yield url
+
+
+def read_profile_urls(path, stats=None):
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        yield from iter_profile_urls(f, stats)
@@ -0,0 +1,113 @@
+import collections
+import logging
+import random
+import threading
+import time
+
+CLEAN = 'clean'
+SLOW = 'slow'
+BLOCKED = 'blocked'
+
+
+class RateController:
+    # Token bucket shared by every worker scraping with the same account.
+    # The refill rate follows AIMD: each clean page load adds a little, a
+    # slow load trims it, and a block signal (login redirect, checkpoint,
+    # empty h1) halves it, so the pace settles just under what the account
+    # gets away with. per_minute=None disables pacing but keeps the meter.
+
+    def __init__(self, per_minute=8, min_per_minute=1, max_per_minute=30, increase=0.25,
+                 slow_factor=0.8, block_factor=0.5, slow_page_seconds=12, jitter=0.3,
+                 window_seconds=300):
+        self.per_minute = per_minute
+        self.min_per_minute = min_per_minute
+        self.max_per_minute = max_per_minute
+        self.increase = increase
+        self.slow_factor = slow_factor
+        self.block_factor = block_factor
+        self.slow_page_seconds = slow_page_seconds
+        self.jitter = jitter
+        self.window_seconds = window_seconds
+        self._next_at = None
+        self._completions = collections.deque()
+        self._started_at = None
+        self._lock = threading.Lock()
+
+    def acquire(self, stop_event=None):
+        # Blocks until this worker may open the next page; returns the wait
+        if self.per_minute is None:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            if self._next_at is None:
+                self._next_at = now
+            start_at = max(now, self._next_at)
+            # Spread the gaps a little so the request pattern isn't metronomic
+            interval = 60 / self.per_minute * random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._next_at = start_at + interval
+
+        delay = start_at - now
+        if delay > 0:
+            if stop_event is not None:
+                stop_event.wait(delay)
+            else:
+                time.sleep(delay)
+        return delay
+
+    def record(self, load_seconds, signal=None):
+        if signal is None:
+            signal = SLOW if load_seconds > self.slow_page_seconds else CLEAN
+        if self.per_minute is None:
+            return signal
+
+        with self._lock:
+            previous = self.per_minute
+            if signal == BLOCKED:
+                self.per_minute = max(self.min_per_minute, self.per_minute * self.block_factor)
+                # Let the slower pace take effect now rather than after the queued gap
+                self._next_at = time.monotonic() + 60 / self.per_minute
+            elif signal == SLOW:
+                self.per_minute = max(self.min_per_minute, self.per_minute * self.slow_factor)
+            else:
+                self.per_minute = min(self.max_per_minute, self.per_minute + self.increase)
+            current = self.per_minute
+
+        if signal != CLEAN:
+            logging.warning(f"Pace {previous:.1f} -> {current:.1f} profiles/min after a {signal} page")
+        return signal
+
+    def completed(self, count=1):
+        now = time.monotonic()
+        with self._lock:
+            if self._started_at is None:
+                self._started_at = now
+            self._completions.extend([now] * count)
+            while self._completions and now - self._completions[0] > self.window_seconds:
+                self._completions.popleft()
+
+    def throughput(self):
+        # Profiles per minute finished over the recent window, all sources included
+        now = time.monotonic()
+        with self._lock:
+            while self._completions and now - self._completions[0] > self.window_seconds:
+                self._completions.popleft()
+            if not self._completions:
+                return 0.0
+            elapsed = min(self.window_seconds, now - self._started_at)
+            return len(self._completions) / max(elapsed, 1) * 60
+
+    def eta(self, remaining):
+        # Seconds left at the measured pace, or at the target pace before anything has finished
+        per_minute = self.throughput() or self.per_minute
+        if not remaining:
+            return 0.0
+        if not per_minute:
+            return None
+        return remaining / per_minute * 60
+
+    def snapshot(self):
+        return {
+            'target_per_minute': round(self.per_minute, 2) if self.per_minute is not None else None,
+            'throughput_per_minute': round(self.throughput(), 2),
+        }
@@ -0,0 +1,72 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from profile_fields import PROFILE_FIELDS
+from profile_urls import normalize_profile_url
+
+
+class ResultCache:
+
+    def __init__(self, path='profile_cache.db', ttl=24 * 3600):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS profiles ('
+            ' url TEXT PRIMARY KEY,'
+            ' data TEXT NOT NULL,'
+            ' fetched_at REAL NOT NULL'
+            ')'
+        )
+        self._conn.commit()
+
+    def _key(self, profile_url):
+        return normalize_profile_url(profile_url) or profile_url.strip()
+
+    def get(self, profile_url, fields=None):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data, fetched_at FROM profiles WHERE url = ?',
+                (self._key(profile_url),)
+            ).fetchone()
+
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+
+        profile = json.loads(row[0])
+        # Entries from field-selective runs only serve requests they cover
+        cached_fields = profile.pop('_fields', PROFILE_FIELDS)
+        if fields and not set(fields) <= set(cached_fields):
+            return None
+        profile['profile_url'] = profile_url
+        return profile
+
+    def put(self, profile, fields=None):
+        data = dict(profile)
+        if fields and set(fields) != set(PROFILE_FIELDS):
+            data['_fields'] = list(fields)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO profiles (url, data, fetched_at) VALUES (?, ?, ?)',
+                (self._key(profile['profile_url']), json.dumps(data), time.time())
+            )
+            self._conn.commit()
+
+    def purge_expired(self):
+        with self._lock:
+            deleted = self._conn.execute(
+                'DELETE FROM profiles WHERE fetched_at < ?',
+                (time.time() - self.ttl,)
+            ).rowcount
+            self._conn.commit()
+        logging.info(f"Purged {deleted} expired profiles from cache")
+        return deleted
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
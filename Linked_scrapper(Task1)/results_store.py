@@ -0,0 +1,158 @@
+import sqlite3
+import threading
+import time
+
+from profile_fields import PROFILE_FIELDNAMES
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    profile_url TEXT NOT NULL,
+    name TEXT NOT NULL DEFAULT '',
+    headline TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    about TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL,
+    scraped_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_job_status ON results (job_id, status);
+CREATE INDEX IF NOT EXISTS idx_results_job_scraped ON results (job_id, scraped_at);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS results_fts USING fts5(
+    name, headline, location, about,
+    content='results', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS results_ai AFTER INSERT ON results BEGIN
+    INSERT INTO results_fts (rowid, name, headline, location, about)
+    VALUES (new.id, new.name, new.headline, new.location, new.about);
+END;
+CREATE TRIGGER IF NOT EXISTS results_ad AFTER DELETE ON results BEGIN
+    INSERT INTO results_fts (results_fts, rowid, name, headline, location, about)
+    VALUES ('delete', old.id, old.name, old.headline, old.location, old.about);
+END;
+"""
+
+
+def _fts_query(search_term):
+    # Every word must match as a prefix; quoting keeps user input from being
+    # parsed as FTS5 query syntax
+    tokens = search_term.split()
+    return ' '.join('"' + token.replace('"', '""') + '"*' for token in tokens)
+
+
+class ResultsStore:
+
+    def __init__(self, path='results.db'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def add(self, job_id, profile):
+        self.add_many(job_id, [profile])
+
+    def add_many(self, job_id, profiles):
+        now = time.time()
+        rows = [
+            (job_id, profile['profile_url'], profile.get('name', ''), profile.get('headline', ''),
+             profile.get('location', ''), profile.get('about', ''), profile['status'], now)
+            for profile in profiles
+        ]
+        with self._lock:
+            self._conn.executemany(
+                'INSERT INTO results (job_id, profile_url, name, headline, location, about, status, scraped_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            self._conn.commit()
+
+    def _where(self, job_id, statuses=None, search=None):
+        clauses = ['results.job_id = ?']
+        params = [job_id]
+
+        if statuses is not None:
+            clauses.append(f"results.status IN ({', '.join('?' for _ in statuses) or 'NULL'})")
+            params.extend(statuses)
+
+        if search and search.strip():
+            clauses.append('results.id IN (SELECT rowid FROM results_fts WHERE results_fts MATCH ?)')
+            params.append(_fts_query(search))
+
+        return ' AND '.join(clauses), params
+
+    def count(self, job_id, statuses=None, search=None):
+        where, params = self._where(job_id, statuses, search)
+        with self._lock:
+            return self._conn.execute(f'SELECT COUNT(*) FROM results WHERE {where}', params).fetchone()[0]
+
+    def query(self, job_id, statuses=None, search=None, limit=100, offset=0):
+        where, params = self._where(job_id, statuses, search)
+        columns = ', '.join(PROFILE_FIELDNAMES)
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT {columns} FROM results WHERE {where} ORDER BY id LIMIT ? OFFSET ?',
+                params + [limit, offset]
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_rows(self, job_id, statuses=None, search=None, batch_size=1000):
+        # Keyset pagination, so large exports never hold more than one batch
+        where, params = self._where(job_id, statuses, search)
+        columns = ', '.join(PROFILE_FIELDNAMES)
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f'SELECT id, {columns} FROM results WHERE {where} AND results.id > ? ORDER BY id LIMIT ?',
+                    params + [last_id, batch_size]
+                ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1]['id']
+            for row in rows:
+                record = dict(row)
+                del record['id']
+                yield record
+
+    def fingerprint(self, job_id):
+        # Rows are only ever appended to a job, so the row count plus the
+        # highest row id identify its result set without reading every row
+        with self._lock:
+            count, max_id = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(MAX(id), 0) FROM results WHERE job_id = ?',
+                (job_id,)
+            ).fetchone()
+        return f'{job_id}:{count}:{max_id}'
+
+    def status_counts(self, job_id):
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT status, COUNT(*) FROM results WHERE job_id = ? GROUP BY status',
+                (job_id,)
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def named_count(self, job_id):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM results WHERE job_id = ? AND name != ''",
+                (job_id,)
+            ).fetchone()[0]
+
+    def recent_jobs(self, limit=20):
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT job_id, COUNT(*), MAX(scraped_at) FROM results'
+                ' GROUP BY job_id ORDER BY MAX(scraped_at) DESC LIMIT ?',
+                (limit,)
+            ).fetchall()
+        return [{'job_id': job_id, 'count': count, 'scraped_at': scraped_at} for job_id, count, scraped_at in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
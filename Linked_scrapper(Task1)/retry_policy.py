@@ -0,0 +1,149 @@
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+
+TRANSIENT = 'transient'
+PERMANENT = 'permanent'
+THROTTLED = 'throttled'
+PARTIAL = 'partial'
+
+# Statuses extract_profile_data reports for pages that will never yield a profile
+PERMANENT_STATUSES = ('not_found', 'restricted')
+
+THROTTLE_URL_MARKERS = ('/checkpoint/', '/authwall', '/uas/login', '/login')
+THROTTLE_TEXT_MARKERS = (
+    'too many requests',
+    "let's do a quick security check",
+    'security verification',
+    "you've reached the weekly limit",
+    'unusual activity',
+)
+NOT_FOUND_URL_MARKERS = ('/404',)
+NOT_FOUND_TEXT_MARKERS = ("this page doesn't exist", 'page not found', 'profile not found')
+RESTRICTED_TEXT_MARKERS = (
+    'this profile is not available',
+    'profile is unavailable',
+    "you don't have access to this profile",
+    'this linkedin member is out of your network',
+)
+
+
+def classify_page(url, title, text):
+    # Status for pages that are not a profile at all, or None if nothing matched
+    url = (url or '').lower()
+    page = f'{title or ""}\n{text or ""}'.lower()
+
+    if any(marker in url for marker in THROTTLE_URL_MARKERS) or any(marker in page for marker in THROTTLE_TEXT_MARKERS):
+        return 'throttled'
+    if any(marker in url for marker in NOT_FOUND_URL_MARKERS) or any(marker in page for marker in NOT_FOUND_TEXT_MARKERS):
+        return 'not_found'
+    if any(marker in page for marker in RESTRICTED_TEXT_MARKERS):
+        return 'restricted'
+    return None
+
+
+def classify_status(status):
+    if status == 'success':
+        return None
+    kind = status.split(':')[0]
+    if kind in PERMANENT_STATUSES:
+        return PERMANENT
+    if kind == 'throttled':
+        return THROTTLED
+    return TRANSIENT
+
+
+class RetryItem:
+    # One URL on its way through the run. slot is where its result goes in
+    # the output; profile holds the best result so far.
+
+    def __init__(self, url, slot=None):
+        self.url = url
+        self.slot = slot
+        self.kind = None
+        self.attempt = 0
+        self.missing_fields = None
+        self.profile = None
+
+
+class RetryScheduler:
+    # Deferred retry queue shared by every worker of a run. Failed URLs come
+    # back after an exponential backoff with jitter instead of being retried
+    # inline; a throttle signal additionally pauses fresh URLs for a while.
+
+    def __init__(self, max_attempts=3, base_delay=30, max_delay=900, throttle_delay=600):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.throttle_delay = throttle_delay
+        self.deferred = 0
+        self.gave_up = 0
+        self._heap = []
+        self._sequence = itertools.count()
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._heap)
+
+    def backoff(self, kind, attempt):
+        base = self.throttle_delay if kind == THROTTLED else self.base_delay
+        delay = min(self.max_delay, base * 2 ** (attempt - 1))
+        # Half fixed, half random, so workers that failed together don't retry together
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def defer(self, item):
+        if item.kind == PERMANENT or item.attempt >= self.max_attempts:
+            with self._lock:
+                self.gave_up += item.kind != PERMANENT
+            return False
+
+        delay = self.backoff(item.kind, item.attempt)
+        due = time.monotonic() + delay
+        with self._lock:
+            if item.kind == THROTTLED:
+                self._cooldown_until = max(self._cooldown_until, due)
+            heapq.heappush(self._heap, (due, next(self._sequence), item))
+            self.deferred += 1
+
+        message = f"Retrying {item.url} ({item.kind}) in {delay:.0f}s, attempt {item.attempt + 1}/{self.max_attempts}"
+        if item.kind == THROTTLED:
+            logging.warning(f"Rate limit or checkpoint hit; pausing new profiles. {message}")
+        else:
+            logging.info(message)
+        return True
+
+    def pop_due(self):
+        with self._lock:
+            if self._heap and self._heap[0][0] <= time.monotonic():
+                return heapq.heappop(self._heap)[2]
+        return None
+
+    def drain(self):
+        # Everything still waiting, e.g. after a stop request
+        with self._lock:
+            items = [entry[2] for entry in sorted(self._heap)]
+            self._heap = []
+        return items
+
+    def wait(self, stop_event, timeout=None):
+        # Sleeps until the next retry is due (or timeout), waking early on stop
+        with self._lock:
+            delay = self._heap[0][0] - time.monotonic() if self._heap else timeout
+        if timeout is not None:
+            delay = timeout if delay is None else min(delay, timeout)
+        if delay is None or delay > 0:
+            stop_event.wait(delay if delay is not None else 1)
+
+    def cooldown_remaining(self):
+        return max(0.0, self._cooldown_until - time.monotonic())
+
+    def wait_cooldown(self, stop_event):
+        remaining = self.cooldown_remaining()
+        if remaining > 0:
+            logging.info(f"Waiting {remaining:.0f}s for the rate-limit pause to end")
+            stop_event.wait(remaining)
@@ -0,0 +1,202 @@
+import asyncio
+import collections
+import logging
+import threading
+import time
+import uuid
+
+from log_pipeline import LOG_FORMAT, attach_handler, detach_handler
+from metrics import ScraperMetrics
+from profile_fields import fieldnames_for
+from rate_controller import RateController
+
+
+class JobLogHandler(logging.Handler):
+    # Keeps the most recent log lines of one job's threads in a ring buffer
+
+    def __init__(self, thread_prefix, capacity=500):
+        super().__init__()
+        self.thread_prefix = thread_prefix
+        self.lines = collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        if record.threadName.startswith(self.thread_prefix):
+            self.lines.append(self.format(record))
+
+
+class ScrapeJob:
+
+    def __init__(self, job_id, email, password, profile_urls, workers=1, scraper_options=None,
+                 results_store=None):
+        self.id = job_id
+        self.email = email
+        self.password = password
+        self.profile_urls = profile_urls
+        self.workers = workers
+        self.scraper_options = dict(scraper_options or {})
+        self.rate_controller = self.scraper_options.pop('rate_controller', None) or RateController()
+        self.fieldnames = fieldnames_for(self.scraper_options.get('fields'))
+        self.results_store = results_store
+        self.metrics = ScraperMetrics()
+        self.state = 'pending'
+        self.message = 'Queued'
+        self.error = None
+        self.total = len(profile_urls)
+        self.completed = 0
+        self.success = 0
+        self.current_url = None
+        self.results = None
+        self._collected = []
+        self.changes = None
+        self.cache_hits = 0
+        self.fresh_scrapes = 0
+        self.created_at = time.time()
+        self.finished_at = None
+        self.scraper = None
+        self._lock = threading.Lock()
+
+        self.log_handler = JobLogHandler(f'scrape-job-{job_id}')
+        self.log_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self._thread = threading.Thread(target=self._run, name=f'scrape-job-{job_id}', daemon=True)
+
+    @property
+    def running(self):
+        return self.state in ('pending', 'running')
+
+    def start(self):
+        attach_handler(self.log_handler)
+        self._thread.start()
+
+    def cancel(self):
+        if not self.running:
+            return
+        with self._lock:
+            self.message = 'Stopping after the current profile...'
+        if self.scraper:
+            self.scraper.stop()
+
+    def _set(self, **fields):
+        with self._lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+
+    def _on_profile(self, profile_data):
+        if self.results_store:
+            self.results_store.add(self.id, profile_data)
+        with self._lock:
+            self.completed += 1
+            if profile_data['status'] == 'success':
+                self.success += 1
+            self.current_url = profile_data['profile_url']
+            self.message = f'Scraped profile {self.completed} of {self.total}'
+
+    def _run(self):
+        # Selenium is only loaded once a job actually runs, keeping it out of
+        # the Streamlit app's start-up
+        from linkedin_scraper import LinkedInScraper
+
+        self._set(state='running', message='Setting up browser...')
+        scraper = LinkedInScraper(
+            self.email,
+            self.password,
+            metrics=self.metrics,
+            rate_controller=self.rate_controller,
+            **self.scraper_options
+        )
+        self.scraper = scraper
+        try:
+            scraper.setup_driver()
+
+            self._set(message='Logging in to LinkedIn...')
+            if not scraper.login():
+                self._set(state='failed', error='Login failed! Please check your credentials.')
+                return
+
+            self._set(message='Scraping profiles...')
+            asyncio.run(self._scrape(scraper))
+
+            self._set(
+                state='cancelled' if scraper.stopped else 'completed',
+                message='Scraping stopped' if scraper.stopped else 'Scraping completed!',
+                results=self._collected
+            )
+        except Exception as e:
+            logging.error(f"Scrape job {self.id} failed: {str(e)}")
+            self._set(state='failed', error=str(e), results=self._collected or None)
+        finally:
+            scraper.close()
+            self._set(
+                cache_hits=scraper.cache_hits,
+                fresh_scrapes=scraper.fresh_scrapes,
+                changes=scraper.changes if scraper.change_tracker else None,
+                finished_at=time.time()
+            )
+            detach_handler(self.log_handler)
+
+    async def _scrape(self, scraper):
+        # One event loop drives every browser; _on_profile runs on the output
+        # thread so job state updates never block the loop
+        async for profile_data in scraper.iter_profiles_async(self.profile_urls, concurrency=self.workers,
+                                                              on_profile=self._on_profile):
+            self._collected.append(profile_data)
+
+    def snapshot(self):
+        pace = self.rate_controller.snapshot()
+        with self._lock:
+            remaining = self.total - self.completed
+            return {
+                'id': self.id,
+                'state': self.state,
+                'message': self.message,
+                'error': self.error,
+                'total': self.total,
+                'completed': self.completed,
+                'success': self.success,
+                'current_url': self.current_url,
+                'cache_hits': self.cache_hits,
+                'fresh_scrapes': self.fresh_scrapes,
+                'throughput_per_minute': pace['throughput_per_minute'],
+                'target_per_minute': pace['target_per_minute'],
+                'eta_seconds': self.rate_controller.eta(remaining) if self.running else 0.0,
+            }
+
+    def recent_logs(self, count=20):
+        lines = list(self.log_handler.lines)
+        return lines[-count:]
+
+
+class JobManager:
+    # Process-wide registry, so jobs outlive the Streamlit script run (and
+    # browser refreshes) that started them
+
+    def __init__(self, results_store=None, keep_finished_for=6 * 3600):
+        self.results_store = results_store
+        self.keep_finished_for = keep_finished_for
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, email, password, profile_urls, workers=1, scraper_options=None):
+        job = ScrapeJob(
+            uuid.uuid4().hex[:12],
+            email,
+            password,
+            profile_urls,
+            workers,
+            scraper_options,
+            results_store=self.results_store
+        )
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        job.start()
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _prune(self):
+        cutoff = time.time() - self.keep_finished_for
+        for job_id, job in list(self._jobs.items()):
+            if job.finished_at and job.finished_at < cutoff:
+                del self._jobs[job_id]
@@ -0,0 +1,57 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+
+class SessionStore:
+
+    def __init__(self, directory='.sessions', max_age=7 * 24 * 3600):
+        self.directory = directory
+        self.max_age = max_age
+
+    def _path(self, email):
+        key = hashlib.sha256(email.strip().lower().encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.directory, f'{key}.json')
+
+    def load(self, email):
+        path = self._path(email)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read saved session {path}: {str(e)}")
+            return None
+
+        if time.time() - session.get('saved_at', 0) > self.max_age:
+            logging.info("Saved session is too old, ignoring it")
+            return None
+
+        now = time.time()
+        session['cookies'] = [
+            cookie for cookie in session.get('cookies', [])
+            if 'expiry' not in cookie or cookie['expiry'] > now
+        ]
+        return session
+
+    def save(self, email, session):
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        path = self._path(email)
+        tmp_path = f'{path}.tmp'
+
+        # Cookies are as good as a password, so keep the file private and
+        # replace it atomically so concurrent readers never see half a file
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(session, f)
+        os.replace(tmp_path, path)
+        logging.info("Session saved for reuse on the next run")
+
+    def clear(self, email):
+        try:
+            os.remove(self._path(email))
+        except FileNotFoundError:
+            pass
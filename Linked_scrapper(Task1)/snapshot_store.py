@@ -0,0 +1,65 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+from profile_urls import normalize_profile_url
+
+
+class SnapshotStore:
+    # Content-addressed store of rendered profile pages. Each page is gzipped
+    # under objects/<aa>/<sha256>.html.gz (identical pages are stored once) and
+    # index.jsonl maps profile URLs to the snapshot taken on each visit.
+
+    def __init__(self, directory='snapshots', compresslevel=6):
+        self.directory = directory
+        self.compresslevel = compresslevel
+        self.index_path = os.path.join(directory, 'index.jsonl')
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+
+    def _object_path(self, digest):
+        return os.path.join(self.directory, 'objects', digest[:2], f'{digest}.html.gz')
+
+    def put(self, profile_url, html):
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=self.compresslevel, mtime=0))
+            os.replace(tmp_path, path)
+
+        entry = {
+            'profile_url': normalize_profile_url(profile_url) or profile_url,
+            'sha256': digest,
+            'fetched_at': time.time()
+        }
+        with self._lock:
+            with open(self.index_path, 'a', encoding='utf-8') as index:
+                index.write(json.dumps(entry) + '\n')
+        return digest
+
+    def get(self, digest):
+        with open(self._object_path(digest), 'rb') as f:
+            return gzip.decompress(f.read()).decode('utf-8')
+
+    def latest(self):
+        # Most recent snapshot per profile URL
+        entries = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as index:
+                for line in index:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    entries[entry['profile_url']] = entry
+        except FileNotFoundError:
+            pass
+        return list(entries.values())
@@ -0,0 +1,220 @@
+import argparse
+import html
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+# Minimal local stand-in for the LinkedIn pages the scraper touches. Markup
+# mirrors the selectors used by login() and extract_profile_data(); profile
+# pages ship their data in a <code> payload (like LinkedIn does) and render
+# the DOM from it after render_delay, so readiness waits have something real
+# to wait for.
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>LinkedIn Login</title></head><body>
+<form method="post" action="/login">
+  <input id="username" name="session_key" type="text">
+  <input id="password" name="session_password" type="password">
+  <button type="submit">Sign in</button>
+</form>
+</body></html>"""
+
+FEED_PAGE = """<!DOCTYPE html>
+<html><head><title>Feed | LinkedIn</title></head><body><h1>Feed</h1></body></html>"""
+
+PROFILE_PAGE = """<!DOCTYPE html>
+<html><head><title>{name} | LinkedIn</title></head><body>
+<code id="bpr-guid-1" style="display: none">{payload}</code>
+<main id="profile"></main>
+<script>
+setTimeout(function () {{
+  var data = JSON.parse(document.getElementById('bpr-guid-1').textContent).included[0];
+  var esc = function (text) {{
+    var div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+  }};
+  document.getElementById('profile').innerHTML =
+    '<section class="artdeco-card pv-top-card">' +
+    '  <h1 class="text-heading-xlarge">' + esc(data.firstName + ' ' + data.lastName) + '</h1>' +
+    '  <div class="text-body-medium break-words">' + esc(data.headline) + '</div>' +
+    '  <span class="text-body-small inline t-black--light break-words">' + esc(data.locationName) + '</span>' +
+    '</section>' +
+    '<div style="height: 1500px"></div>' +
+    '<section class="artdeco-card">' +
+    '  <div id="about" class="pv-profile-card__anchor"></div>' +
+    '  <div class="display-flex ph5 pv3"><div><span aria-hidden="true">' + esc(data.summary) + '</span></div></div>' +
+    '</section>';
+}}, {render_delay_ms});
+</script>
+</body></html>"""
+
+ERROR_PAGE = """<!DOCTYPE html>
+<html><head><title>Error</title></head><body><p>Something went wrong</p></body></html>"""
+
+PROFILE_PATH_RE = re.compile(r'^/in/([^/?#]+)/?')
+
+HEADLINES = ['Chief Executive Officer', 'VP of Engineering', 'Head of Growth', 'Founder & CTO', 'Sales Director']
+LOCATIONS = ['Seattle, Washington, United States', 'London, England, United Kingdom', 'Berlin, Germany',
+             'Bengaluru, Karnataka, India', 'San Francisco Bay Area']
+
+
+def fixture_profile(slug):
+    rng = random.Random(slug)
+    words = [part.capitalize() for part in slug.replace('_', '-').split('-') if part.isalpha()] or ['Profile']
+    return {
+        'firstName': words[0],
+        'lastName': ' '.join(words[1:]) or 'Person',
+        'headline': rng.choice(HEADLINES),
+        'locationName': rng.choice(LOCATIONS),
+        'summary': f"{words[0]} has spent {rng.randint(5, 30)} years building teams and products.",
+    }
+
+
+class StandInConfig:
+
+    def __init__(self, latency=0.0, render_delay=0.5, failure_rate=0.0, seed=None):
+        self.latency = latency
+        self.render_delay = render_delay
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    config = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _cookies(self):
+        cookies = {}
+        for part in self.headers.get('Cookie', '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name:
+                cookies[name] = value
+        return cookies
+
+    def _logged_in(self):
+        return self._cookies().get('li_at') == 'standin-token'
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or []):
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location, headers=None):
+        self.send_response(302)
+        self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
+        for name, value in (headers or []):
+            self.send_header(name, value)
+        self.end_headers()
+
+    def do_GET(self):
+        config = self.config
+        with config.lock:
+            config.requests += 1
+        if config.latency:
+            time.sleep(config.latency)
+
+        path = self.path.split('?')[0]
+
+        if path == '/robots.txt':
+            self._send(200, 'User-agent: *\nDisallow: /\n', 'text/plain')
+        elif path == '/login':
+            self._send(200, LOGIN_PAGE)
+        elif path.startswith('/feed'):
+            if self._logged_in():
+                self._send(200, FEED_PAGE)
+            else:
+                self._redirect('/login')
+        elif path == '/voyager/api/me':
+            if self._logged_in():
+                self._send(200, json.dumps({'plainId': 1}), 'application/json')
+            else:
+                self._send(401, '{}', 'application/json')
+        elif PROFILE_PATH_RE.match(path):
+            self._profile(PROFILE_PATH_RE.match(path).group(1))
+        else:
+            self._send(404, ERROR_PAGE)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        form = parse_qs(self.rfile.read(length).decode('utf-8'))
+        if self.path == '/login' and form.get('session_key') and form.get('session_password'):
+            self._redirect('/feed/', headers=[
+                ('Set-Cookie', 'li_at=standin-token; Path=/'),
+                ('Set-Cookie', 'JSESSIONID="ajax:standin"; Path=/'),
+            ])
+        else:
+            self._send(200, LOGIN_PAGE)
+
+    def _profile(self, slug):
+        config = self.config
+        if not self._logged_in():
+            self._redirect('/login')
+            return
+
+        with config.lock:
+            failed = config.random.random() < config.failure_rate
+            if failed:
+                config.failures += 1
+        if failed:
+            self._send(500, ERROR_PAGE)
+            return
+
+        profile = fixture_profile(slug)
+        # Escape for safe embedding in HTML; the page script reads textContent
+        payload = html.escape(json.dumps({'included': [profile]}), quote=False)
+        self._send(200, PROFILE_PAGE.format(
+            name=html.escape(f"{profile['firstName']} {profile['lastName']}"),
+            payload=payload,
+            render_delay_ms=int(config.render_delay * 1000)
+        ))
+
+
+def start_standin_server(host='127.0.0.1', port=0, **config):
+    handler = type('ConfiguredStandInHandler', (StandInHandler,), {'config': StandInConfig(**config)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name='standin-server', daemon=True)
+    thread.start()
+    return server, f'http://{host}:{server.server_address[1]}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve local LinkedIn stand-in pages")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds before each response")
+    parser.add_argument('--render-delay', type=float, default=0.5, help="Seconds before profile DOM renders")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="Share of profile requests answered with 500")
+    args = parser.parse_args()
+
+    server, base_url = start_standin_server(
+        port=args.port,
+        latency=args.latency,
+        render_delay=args.render_delay,
+        failure_rate=args.failure_rate
+    )
+    print(f"Stand-in server running at {base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
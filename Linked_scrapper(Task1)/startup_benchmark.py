@@ -0,0 +1,136 @@
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from log_pipeline import configure_logging
+from standin_server import start_standin_server
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# What app.py imports before it renders anything; streamlit itself brings
+# in pandas and pyarrow, so it is part of the real start-up cost
+APP_IMPORTS = (
+    'streamlit',
+    'session_store',
+    'result_cache',
+    'profile_urls',
+    'scrape_jobs',
+    'rate_controller',
+    'results_store',
+    'profile_fields',
+    'exporters',
+    'log_pipeline',
+    'change_tracker',
+)
+
+HEAVY_MODULES = ('selenium', 'pandas', 'openpyxl', 'pyarrow')
+
+# Runs in a fresh interpreter so nothing is already cached in sys.modules
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{'seconds': elapsed, 'heavy_loaded': heavy}}))
+"""
+
+
+def measure_import(modules, repeats=5):
+    probe = IMPORT_PROBE.format(heavy=HEAVY_MODULES)
+    runs = []
+    for _ in range(repeats):
+        probe_run = subprocess.run(
+            [sys.executable, '-c', probe, *modules],
+            cwd=HERE,
+            capture_output=True,
+            text=True
+        )
+        if probe_run.returncode:
+            lines = probe_run.stderr.strip().splitlines()
+            return {'error': lines[-1] if lines else f'exit code {probe_run.returncode}'}
+        runs.append(json.loads(probe_run.stdout))
+    return {
+        'median_seconds': round(statistics.median(run['seconds'] for run in runs), 4),
+        'min_seconds': round(min(run['seconds'] for run in runs), 4),
+        'heavy_loaded': runs[-1]['heavy_loaded'],
+    }
+
+
+def run_import_benchmark(repeats=5):
+    report = {'app': measure_import(APP_IMPORTS, repeats)}
+    for name in ('streamlit', 'linkedin_scraper', 'scrape_jobs', 'exporters', 'pandas', 'selenium.webdriver'):
+        report[name] = measure_import([name], repeats)
+    return report
+
+
+def time_to_login(scraper):
+    start = time.perf_counter()
+    scraper.setup_driver()
+    if not scraper.login():
+        raise RuntimeError("Login against the stand-in server failed")
+    return time.perf_counter() - start
+
+
+def run_startup_benchmark(prompt_seconds=5.0, lightweight=True, latency=0.0):
+    # Time from "prompts answered" to "logged in", launching Chrome only then
+    # (cold) versus launching it while the prompts were open (pre-warmed)
+    from linkedin_scraper import LinkedInScraper, prewarm_browser
+
+    server, base_url = start_standin_server(latency=latency, render_delay=0.0)
+    options = {'lightweight': lightweight, 'base_url': base_url}
+    try:
+        scraper = LinkedInScraper('bench@example.com', 'password', **options)
+        try:
+            cold = time_to_login(scraper)
+        finally:
+            scraper.close()
+
+        driver_manager = prewarm_browser(lightweight=lightweight, base_url=base_url)
+        time.sleep(prompt_seconds)
+        scraper = LinkedInScraper('bench@example.com', 'password', driver_manager=driver_manager, **options)
+        try:
+            warm = time_to_login(scraper)
+        finally:
+            scraper.close()
+    finally:
+        server.shutdown()
+
+    return {
+        'prompt_seconds': prompt_seconds,
+        'cold_seconds': round(cold, 3),
+        'prewarmed_seconds': round(warm, 3),
+        'saved_seconds': round(cold - warm, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark import time and time to first login")
+    parser.add_argument('--repeats', type=int, default=5, help="Fresh interpreters per import measurement")
+    parser.add_argument('--prompt-seconds', type=float, default=5.0,
+                        help="Simulated time the user spends on prompts before scraping starts")
+    parser.add_argument('--headed', action='store_true', help="Benchmark a visible Chrome instead of headless")
+    parser.add_argument('--imports-only', action='store_true', help="Skip the Chrome start-up measurement")
+    parser.add_argument('--output', help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    configure_logging(level=logging.WARNING)
+
+    report = {'imports': run_import_benchmark(args.repeats)}
+    if not args.imports_only:
+        report['startup'] = run_startup_benchmark(args.prompt_seconds, lightweight=not args.headed)
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import csv
+
+import pytest
+
+from change_tracker import ChangeTracker, ChangeWriter
+
+URL = 'https://www.linkedin.com/in/jane-doe/'
+
+
+def profile(status='success', **values):
+    record = {'profile_url': URL, 'name': 'Jane Doe', 'headline': 'Founder', 'location': 'Berlin',
+              'about': 'Builds things.', 'status': status}
+    record.update(values)
+    return record
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = ChangeTracker(str(tmp_path / 'changes.db'))
+    yield tracker
+    tracker.close()
+
+
+def test_first_sighting_is_new(tracker):
+    change = tracker.observe(profile())
+
+    assert change['change'] == 'new'
+    assert change['changed_fields'] == 'headline;location;about'
+
+
+def test_same_values_are_not_a_change(tracker):
+    tracker.observe(profile())
+
+    # Whitespace differences alone don't count
+    assert tracker.observe(profile(about='Builds   things. ')) is None
+    assert tracker.counts == {'new': 1, 'changed': 0, 'disappeared': 0, 'unchanged': 1}
+
+
+def test_edited_fields_are_reported(tracker):
+    tracker.observe(profile())
+
+    change = tracker.observe(profile(headline='CEO', location='Paris'))
+
+    assert change['change'] == 'changed'
+    assert change['changed_fields'] == 'headline;location'
+    assert tracker.observe(profile(headline='CEO', location='Paris')) is None
+
+
+def test_url_variants_are_the_same_profile(tracker):
+    tracker.observe(profile())
+
+    assert tracker.observe(profile(profile_url='https://uk.linkedin.com/in/Jane-Doe?trk=x')) is None
+
+
+def test_fields_missing_from_the_page_are_not_changes(tracker):
+    tracker.observe(profile())
+
+    assert tracker.observe(profile(location='', about=''), missing=['location', 'about']) is None
+    # The stored values survive for the next full read
+    assert tracker.observe(profile()) is None
+
+
+def test_fields_a_selective_run_skipped_become_a_baseline(tracker):
+    tracker.observe(profile(), fields=('name', 'headline'))
+
+    assert tracker.observe(profile()) is None
+    change = tracker.observe(profile(about='Now retired.'))
+    assert change['changed_fields'] == 'about'
+
+
+def test_permanent_failure_reports_the_last_known_values(tracker):
+    tracker.observe(profile())
+
+    change = tracker.observe(profile(status='not_found', name='', headline='', location='', about=''))
+
+    assert change['change'] == 'disappeared'
+    assert change['headline'] == 'Founder'
+    # Only reported once
+    assert tracker.observe(profile(status='not_found')) is None
+
+
+def test_profile_back_after_disappearing_is_new_again(tracker):
+    tracker.observe(profile())
+    tracker.observe(profile(status='restricted'))
+
+    assert tracker.observe(profile())['change'] == 'new'
+
+
+def test_transient_failures_and_unknown_profiles_are_ignored(tracker):
+    tracker.observe(profile())
+
+    assert tracker.observe(profile(status='error: timeout', headline='')) is None
+    assert tracker.observe(profile(status='throttled')) is None
+    assert tracker.observe(profile(status='not_found', profile_url='https://www.linkedin.com/in/other/')) is None
+    assert tracker.observe(profile(profile_url='https://example.com/jane')) is None
+
+
+def test_change_writer_appends_on_resume(tmp_path):
+    path = tmp_path / 'changes.csv'
+    writer = ChangeWriter(str(path))
+    writer.write(dict(profile(), change='new', changed_fields='headline'))
+    writer.close()
+
+    writer = ChangeWriter(str(path), resume=True)
+    writer.write(dict(profile(headline='CEO'), change='changed', changed_fields='headline'))
+    writer.close()
+
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [(row['change'], row['headline']) for row in rows] == [('new', 'Founder'), ('changed', 'CEO')]
@@ -0,0 +1,129 @@
+import csv
+
+from checkpoint import CheckpointWriter
+
+FIELDS = ['profile_url', 'name', 'status']
+
+
+def record(slug):
+    return {'profile_url': f'https://www.linkedin.com/in/{slug}/', 'name': slug.title(), 'status': 'success'}
+
+
+def read_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def write_records(path, slugs, resume=False):
+    writer = CheckpointWriter(str(path), FIELDS, resume=resume)
+    for slug in slugs:
+        writer.write(record(slug), slug)
+    writer.close()
+    return writer
+
+
+def test_resume_skips_journaled_urls_and_appends(tmp_path):
+    path = tmp_path / 'out.csv'
+    write_records(path, ['a', 'b'])
+
+    writer = CheckpointWriter(str(path), FIELDS, resume=True)
+    assert writer.completed_urls == {'a', 'b'}
+    writer.write(record('c'), 'c')
+    writer.close()
+
+    assert [row['name'] for row in read_rows(path)] == ['A', 'B', 'C']
+
+
+def test_resume_truncates_a_torn_row(tmp_path):
+    path = tmp_path / 'out.csv'
+    write_records(path, ['a', 'b'])
+    # A crash halfway through the next row
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('https://www.linkedin.com/in/c/,Ha')
+
+    writer = CheckpointWriter(str(path), FIELDS, resume=True)
+    writer.close()
+
+    assert [row['name'] for row in read_rows(path)] == ['A', 'B']
+
+
+def test_resume_ignores_journal_entries_past_the_data(tmp_path):
+    path = tmp_path / 'out.csv'
+    write_records(path, ['a', 'b'])
+    # The journal reached disk but the last row did not
+    with open(path, 'rb') as f:
+        data = f.read()
+    first_row_end = data.index(b'\n', data.index(b'\n') + 1) + 1
+    with open(path, 'wb') as f:
+        f.write(data[:first_row_end])
+
+    writer = CheckpointWriter(str(path), FIELDS, resume=True)
+    assert writer.completed_urls == {'a'}
+    writer.close()
+
+    with open(f'{path}.journal', encoding='utf-8') as journal:
+        assert len(journal.readlines()) == 1
+    assert [row['name'] for row in read_rows(path)] == ['A']
+
+
+def test_resume_drops_a_partial_journal_line(tmp_path):
+    path = tmp_path / 'out.csv'
+    write_records(path, ['a'])
+    with open(f'{path}.journal', 'a', encoding='utf-8') as journal:
+        journal.write('99')
+
+    writer = CheckpointWriter(str(path), FIELDS, resume=True)
+    assert writer.completed_urls == {'a'}
+    writer.close()
+
+
+def test_resume_without_journal_trusts_existing_rows(tmp_path):
+    path = tmp_path / 'out.csv'
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerow(record('a'))
+
+    writer = CheckpointWriter(str(path), FIELDS, resume=True)
+    assert writer.completed_urls == {'https://www.linkedin.com/in/a/'}
+    writer.write(record('b'), 'https://www.linkedin.com/in/b/')
+    writer.close()
+
+    assert [row['name'] for row in read_rows(path)] == ['A', 'B']
+
+
+def test_fresh_run_starts_over(tmp_path):
+    path = tmp_path / 'out.csv'
+    write_records(path, ['a', 'b'])
+    writer = write_records(path, ['c'])
+
+    assert writer.completed_urls == {'c'}
+    assert [row['name'] for row in read_rows(path)] == ['C']
+
+
+def test_rebuilt_journal_uses_normalized_urls(tmp_path):
+    path = tmp_path / 'out.csv'
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerow({'profile_url': 'http://uk.linkedin.com/in/Jane-Doe?trk=x', 'name': 'Jane', 'status': 'success'})
+
+    writer = CheckpointWriter(str(path), FIELDS, resume=True)
+    writer.close()
+
+    assert writer.completed_urls == {'https://www.linkedin.com/in/jane-doe/'}
+
+
+def test_resume_without_csv_discards_a_stale_journal(tmp_path):
+    path = tmp_path / 'out.csv'
+    write_records(path, ['a', 'b'])
+    path.unlink()
+
+    writer = CheckpointWriter(str(path), FIELDS, resume=True)
+    assert writer.completed_urls == set()
+    writer.write(record('c'), 'c')
+    writer.close()
+
+    with open(f'{path}.journal', encoding='utf-8') as journal:
+        assert [line.split('\t')[1] for line in journal.read().splitlines()] == ['c']
+    assert [row['name'] for row in read_rows(path)] == ['C']
@@ -0,0 +1,83 @@
+import csv
+import json
+import os
+
+import pytest
+
+from exporters import ExportCache, export_records
+
+RECORDS = [
+    {'profile_url': 'https://www.linkedin.com/in/ada/', 'name': 'Ada', 'headline': 'Engineer',
+     'location': 'London', 'about': 'Notes on the engine', 'status': 'success', 'extra': 'dropped'},
+    {'profile_url': 'https://www.linkedin.com/in/linus/', 'name': '', 'headline': '', 'location': '',
+     'about': '', 'status': 'not_found'},
+]
+FIELDNAMES = ['profile_url', 'name', 'status']
+
+
+def test_csv_export_keeps_only_the_chosen_fields(tmp_path):
+    path = tmp_path / 'out.csv'
+
+    assert export_records(iter(RECORDS), str(path), 'csv', FIELDNAMES) == 2
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == FIELDNAMES
+    assert rows[1] == {'profile_url': 'https://www.linkedin.com/in/linus/', 'name': '', 'status': 'not_found'}
+
+
+def test_jsonl_export_writes_one_object_per_line(tmp_path):
+    path = tmp_path / 'out.jsonl'
+
+    assert export_records(iter(RECORDS), str(path), 'jsonl', FIELDNAMES) == 2
+    with open(path, encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+    assert rows[0] == {'profile_url': 'https://www.linkedin.com/in/ada/', 'name': 'Ada', 'status': 'success'}
+
+
+def test_xlsx_export(tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    path = tmp_path / 'out.xlsx'
+
+    assert export_records(iter(RECORDS), str(path), 'xlsx', FIELDNAMES) == 2
+    sheet = openpyxl.load_workbook(path).active
+    assert [cell.value for cell in sheet[1]] == FIELDNAMES
+    assert sheet.cell(row=2, column=2).value == 'Ada'
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_records(RECORDS, str(tmp_path / 'out.txt'), 'txt')
+
+
+def test_export_cache_builds_once_per_result_set(tmp_path):
+    cache = ExportCache(str(tmp_path / 'exports'))
+    assert cache.get('job1:2:2', 'csv') is None
+
+    path = cache.create('job1:2:2', 'csv', iter(RECORDS))
+
+    assert cache.get('job1:2:2', 'csv') == path
+    assert cache.get('job1:3:3', 'csv') is None
+    assert cache.get('job1:2:2', 'csv', FIELDNAMES) is None
+    assert os.listdir(tmp_path / 'exports') == [os.path.basename(path)]
+
+
+def test_export_cache_keeps_the_newest_files(tmp_path):
+    cache = ExportCache(str(tmp_path / 'exports'), max_files=2)
+    paths = []
+    for count in range(3):
+        paths.append(cache.create(f'job1:{count}:{count}', 'jsonl', iter(RECORDS)))
+        os.utime(paths[-1], (count, count))
+
+    assert sorted(os.listdir(tmp_path / 'exports')) == sorted(os.path.basename(path) for path in paths[1:])
+
+
+def test_failed_export_leaves_no_partial_file(tmp_path):
+    cache = ExportCache(str(tmp_path / 'exports'))
+
+    def broken_records():
+        yield RECORDS[0]
+        raise RuntimeError('result store went away')
+
+    with pytest.raises(RuntimeError):
+        cache.create('job1:2:2', 'csv', broken_records())
+    assert os.listdir(tmp_path / 'exports') == []
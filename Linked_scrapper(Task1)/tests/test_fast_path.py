@@ -0,0 +1,122 @@
+import pytest
+
+from http_fetch import HttpProfileFetcher
+from linkedin_scraper import LinkedInScraper
+from profile_parser import parse_profile_html, parse_profile_page
+from standin_server import fixture_profile, start_standin_server
+
+SESSION_COOKIES = [{'name': 'li_at', 'value': 'standin-token'}]
+
+TOP_CARD = (
+    '<h1>Jane Doe</h1>'
+    '<div class="text-body-medium">Founder</div>'
+    '<span class="text-body-small inline t-black--light break-words">Berlin</span>'
+)
+EMPTY_ABOUT = '<section class="artdeco-card"><div id="about"></div></section>'
+
+
+class PageFetcher:
+
+    def __init__(self, page_html):
+        self.page_html = page_html
+
+    def fetch(self, profile_url):
+        return self.page_html
+
+    def close(self):
+        pass
+
+
+class CookieDriver:
+    # Just enough of a WebDriver for HttpProfileFetcher.from_driver
+
+    def execute_script(self, script):
+        return 'Mozilla/5.0 (standin)'
+
+    def get_cookies(self):
+        return SESSION_COOKIES
+
+
+@pytest.fixture
+def standin():
+    server, base_url = start_standin_server(render_delay=0)
+    yield server, base_url
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetched_page_parses_from_the_embedded_payload(standin):
+    _, base_url = standin
+    fetcher = HttpProfileFetcher(SESSION_COOKIES)
+    profile_url = f'{base_url}/in/jane-doe/'
+
+    page_html = fetcher.fetch(profile_url)
+    fetcher.close()
+
+    expected = fixture_profile('jane-doe')
+    profile_data = parse_profile_html(page_html, profile_url)
+    assert profile_data['status'] == 'success'
+    assert profile_data['name'] == 'Jane Doe'
+    assert profile_data['headline'] == expected['headline']
+    assert profile_data['location'] == expected['locationName']
+    assert profile_data['about'] == expected['summary']
+
+
+def test_fetch_without_a_session_is_not_followed_to_login(standin):
+    _, base_url = standin
+    fetcher = HttpProfileFetcher([])
+
+    assert fetcher.fetch(f'{base_url}/in/jane-doe/') is None
+    fetcher.close()
+
+
+def test_fetch_returns_none_on_server_errors(standin):
+    server, base_url = standin
+    server.RequestHandlerClass.config.failure_rate = 1.0
+    fetcher = HttpProfileFetcher(SESSION_COOKIES)
+
+    assert fetcher.fetch(f'{base_url}/in/jane-doe/') is None
+    fetcher.close()
+
+
+def test_scraper_uses_the_fast_path_when_it_has_every_field(standin):
+    _, base_url = standin
+    scraper = LinkedInScraper('user@example.com', 'secret', fast_path=True, base_url=base_url)
+    scraper.driver = CookieDriver()
+
+    profile_data = scraper._fetch_profile_http(f'{base_url}/in/jane-doe/')
+
+    assert profile_data['name'] == 'Jane Doe'
+    assert scraper.fast_path_hits == 1
+    scraper.http_fetcher.close()
+
+
+def test_scraper_falls_back_to_the_browser_when_the_fetch_fails(standin):
+    server, base_url = standin
+    server.RequestHandlerClass.config.failure_rate = 1.0
+    scraper = LinkedInScraper('user@example.com', 'secret', fast_path=True, base_url=base_url)
+    scraper.driver = CookieDriver()
+
+    assert scraper._fetch_profile_http(f'{base_url}/in/jane-doe/') is None
+    assert scraper.fast_path_hits == 0
+    scraper.http_fetcher.close()
+
+
+def test_empty_about_section_is_reported_missing():
+    _, missing = parse_profile_page(f'<html><body>{TOP_CARD}{EMPTY_ABOUT}</body></html>', 'u')
+    assert missing == ['about']
+
+    profile_data, missing = parse_profile_page(f'<html><body>{TOP_CARD}</body></html>', 'u')
+    assert missing == []
+    assert profile_data['about'] == ''
+
+
+def test_scraper_falls_back_when_about_section_did_not_parse():
+    scraper = LinkedInScraper('user@example.com', 'secret', fast_path=True)
+    scraper.http_fetcher = PageFetcher(f'<html><body>{TOP_CARD}{EMPTY_ABOUT}</body></html>')
+    assert scraper._fetch_profile_http('https://www.linkedin.com/in/jane-doe/') is None
+
+    # Without about among the requested fields the same page is good enough
+    scraper = LinkedInScraper('user@example.com', 'secret', fast_path=True, fields=['name', 'headline'])
+    scraper.http_fetcher = PageFetcher(f'<html><body>{TOP_CARD}{EMPTY_ABOUT}</body></html>')
+    assert scraper._fetch_profile_http('https://www.linkedin.com/in/jane-doe/')['name'] == 'Jane Doe'
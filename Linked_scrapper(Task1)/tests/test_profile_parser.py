@@ -0,0 +1,34 @@
+import csv
+import hashlib
+import os
+
+from profile_parser import parse_snapshots
+from snapshot_store import SnapshotStore
+
+PAGE = (
+    '<html><body><h1>{name}</h1>'
+    '<div class="text-body-medium">Founder</div>'
+    '<span class="text-body-small inline t-black--light break-words">Berlin</span>'
+    '</body></html>'
+)
+
+
+def test_parse_snapshots_writes_one_row_per_profile(tmp_path):
+    directory = str(tmp_path / 'snapshots')
+    store = SnapshotStore(directory)
+    store.put('https://www.linkedin.com/in/ada/', PAGE.format(name='Ada Lovelace'))
+    store.put('https://www.linkedin.com/in/grace/', PAGE.format(name='Grace Hopper'))
+    # A snapshot whose object went missing is reported, not fatal
+    digest = hashlib.sha256(PAGE.format(name='Grace Hopper').encode('utf-8')).hexdigest()
+    os.remove(store._object_path(digest))
+    output = tmp_path / 'offline.csv'
+
+    assert parse_snapshots(directory, str(output), processes=2) == 2
+
+    with open(output, newline='', encoding='utf-8') as f:
+        rows = {row['profile_url']: row for row in csv.DictReader(f)}
+    ada = rows['https://www.linkedin.com/in/ada/']
+    assert ada['name'] == 'Ada Lovelace'
+    assert ada['location'] == 'Berlin'
+    assert ada['status'] == 'success'
+    assert rows['https://www.linkedin.com/in/grace/']['status'].startswith('error')
@@ -0,0 +1,68 @@
+import pytest
+
+from profile_urls import iter_profile_urls, normalize_profile_url, read_profile_urls
+
+CANONICAL = 'https://www.linkedin.com/in/jane-doe/'
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.linkedin.com/in/jane-doe/',
+    'https://www.linkedin.com/in/jane-doe',
+    'http://linkedin.com/in/Jane-Doe/',
+    'www.linkedin.com/in/jane-doe',
+    'https://uk.linkedin.com/in/jane-doe/',
+    'https://www.linkedin.com:443/in/jane-doe/',
+    'https://www.linkedin.com/in/jane-doe/details/experience/',
+    'https://www.linkedin.com/in/jane-doe?trk=public_profile#about',
+    '  https://www.linkedin.com/in/%4Aane-doe/  ',
+])
+def test_profile_url_variants_normalize_to_one_url(url):
+    assert normalize_profile_url(url) == CANONICAL
+
+
+@pytest.mark.parametrize('url', [
+    '',
+    '   ',
+    'https://example.com/in/jane-doe/',
+    'https://notlinkedin.com/in/jane-doe/',
+    'https://www.linkedin.com/company/acme/',
+    'https://www.linkedin.com/in/',
+    'https://www.linkedin.com/in/%20/',
+])
+def test_non_profile_urls_are_rejected(url):
+    assert normalize_profile_url(url) is None
+
+
+def test_iter_profile_urls_dedups_and_counts():
+    lines = [
+        '# exported from the CRM',
+        '',
+        'https://www.linkedin.com/in/jane-doe/',
+        'https://uk.linkedin.com/in/Jane-Doe?trk=x',
+        b'https://www.linkedin.com/in/john/\n',
+        'https://www.linkedin.com/company/acme/',
+    ]
+    stats = {}
+
+    urls = list(iter_profile_urls(lines, stats))
+
+    assert urls == [CANONICAL, 'https://www.linkedin.com/in/john/']
+    assert stats == {'accepted': 2, 'duplicates': 1, 'rejected': 1}
+
+
+def test_iter_profile_urls_is_lazy():
+    def lines():
+        yield 'https://www.linkedin.com/in/a/'
+        raise AssertionError('read past the first URL')
+
+    assert next(iter_profile_urls(lines())) == 'https://www.linkedin.com/in/a/'
+
+
+def test_read_profile_urls_from_file(tmp_path):
+    path = tmp_path / 'urls.txt'
+    path.write_text('linkedin.com/in/a\nlinkedin.com/in/A/\nlinkedin.com/in/b\n', encoding='utf-8')
+
+    assert list(read_profile_urls(str(path))) == [
+        'https://www.linkedin.com/in/a/',
+        'https://www.linkedin.com/in/b/',
+    ]
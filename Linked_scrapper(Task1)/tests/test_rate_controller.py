@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from rate_controller import BLOCKED, CLEAN, SLOW, RateController
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(random, 'uniform', lambda low, high: 1.0)
+
+
+def test_clean_pages_add_a_step_up_to_the_ceiling(clock):
+    rate = RateController(per_minute=8, max_per_minute=9, increase=0.25)
+
+    assert rate.record(3) == CLEAN
+    assert rate.per_minute == 8.25
+    for _ in range(10):
+        rate.record(3)
+    assert rate.per_minute == 9
+
+
+def test_slow_page_trims_the_pace(clock):
+    rate = RateController(per_minute=10, slow_factor=0.8, slow_page_seconds=12)
+
+    assert rate.record(13) == SLOW
+    assert rate.per_minute == 8
+
+
+def test_block_halves_the_pace_down_to_the_floor(clock):
+    rate = RateController(per_minute=8, min_per_minute=3, block_factor=0.5)
+
+    assert rate.record(1, BLOCKED) == BLOCKED
+    assert rate.per_minute == 4
+    rate.record(1, BLOCKED)
+    assert rate.per_minute == 3
+
+
+def test_block_applies_the_slower_pace_to_the_next_page(clock):
+    rate = RateController(per_minute=12, block_factor=0.5)
+    rate.acquire()
+    rate.record(1, BLOCKED)
+
+    # 6 per minute: the next page waits a full 10s from the block
+    assert rate.acquire() == 10
+
+
+def test_acquire_spaces_pages_by_the_current_pace(clock):
+    rate = RateController(per_minute=6)
+
+    assert rate.acquire() == 0
+    assert rate.acquire() == 10
+    assert clock.slept == [10]
+
+
+def test_unpaced_controller_only_measures(clock):
+    rate = RateController(per_minute=None)
+
+    assert rate.acquire() == 0
+    assert rate.record(30) == SLOW
+    assert rate.per_minute is None
+
+
+def test_throughput_and_eta(clock):
+    rate = RateController(per_minute=4, window_seconds=300)
+    assert rate.eta(8) == 120
+    assert rate.eta(0) == 0
+
+    rate.completed()
+    clock.now += 60
+    rate.completed(2)
+    assert rate.throughput() == 3
+    assert rate.eta(6) == 120
+
+    clock.now += 301
+    assert rate.throughput() == 0
@@ -0,0 +1,80 @@
+import pytest
+
+from linkedin_scraper import LinkedInScraper
+from rate_controller import RateController
+from result_cache import ResultCache
+
+URL = 'https://www.linkedin.com/in/jane-doe/'
+
+
+def profile(**values):
+    record = {'profile_url': URL, 'name': 'Jane Doe', 'headline': 'Founder', 'location': 'Berlin',
+              'about': 'Builds things.', 'status': 'success'}
+    record.update(values)
+    return record
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache.db'), ttl=3600)
+    yield cache
+    cache.close()
+
+
+def test_hit_is_served_under_the_requested_url(cache):
+    cache.put(profile())
+
+    hit = cache.get('https://uk.linkedin.com/in/Jane-Doe?trk=x')
+    assert hit['name'] == 'Jane Doe'
+    assert hit['profile_url'] == 'https://uk.linkedin.com/in/Jane-Doe?trk=x'
+
+
+def test_entries_expire_after_the_ttl(cache, clock):
+    cache.put(profile())
+
+    clock.now += 3600
+    assert cache.get(URL) is not None
+    clock.now += 1
+    assert cache.get(URL) is None
+    assert cache.purge_expired() == 1
+
+
+def test_field_subset_entries_only_serve_what_they_cover(cache):
+    cache.put(profile(about=''), fields=('name', 'headline', 'location'))
+
+    assert cache.get(URL, ('name', 'headline')) is not None
+    assert cache.get(URL, ('name', 'about')) is None
+    assert cache.get(URL) is not None
+    assert cache.get(URL, ('name', 'headline', 'location', 'about')) is None
+
+
+def test_full_entries_serve_any_subset(cache):
+    cache.put(profile())
+
+    assert cache.get(URL, ('about',))['about'] == 'Builds things.'
+
+
+class StubScraper(LinkedInScraper):
+    # The page renders a name and nothing else
+
+    visits = 0
+
+    def extract_profile_data(self, profile_url, fields=None):
+        StubScraper.visits += 1
+        self.last_missing_fields = ['headline', 'location']
+        return profile(profile_url=profile_url, headline='', location='', about='')
+
+    def _after_page(self, profile_data):
+        return False
+
+
+def test_partial_profiles_are_not_cached(cache):
+    scraper = StubScraper('user@example.com', 'secret', result_cache=cache,
+                          rate_controller=RateController(per_minute=None))
+
+    scraper.get_profile(URL)
+    scraper.get_profile(URL)
+
+    assert StubScraper.visits == 2
+    assert scraper.cache_hits == 0
+    assert cache.get(URL) is None
@@ -0,0 +1,64 @@
+import pytest
+
+from results_store import ResultsStore
+
+
+def profile(slug, status='success', **values):
+    record = {'profile_url': f'https://www.linkedin.com/in/{slug}/', 'name': slug.title(), 'headline': '',
+              'location': '', 'about': '', 'status': status}
+    record.update(values)
+    return record
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultsStore(str(tmp_path / 'results.db'))
+    store.add_many('job1', [
+        profile('ada', headline='Chief Engineer', location='London'),
+        profile('grace', headline='Rear Admiral', about='Wrote the first compiler'),
+        profile('linus', status='not_found'),
+    ])
+    store.add('job2', profile('ada', headline='Retired'))
+    yield store
+    store.close()
+
+
+def test_results_are_kept_per_job(store):
+    assert store.count('job1') == 3
+    assert [row['name'] for row in store.query('job2')] == ['Ada']
+    assert store.status_counts('job1') == {'success': 2, 'not_found': 1}
+
+
+def test_status_filter(store):
+    assert store.count('job1', statuses=['not_found']) == 1
+    assert store.count('job1', statuses=[]) == 0
+
+
+def test_search_matches_word_prefixes_across_fields(store):
+    assert [row['name'] for row in store.query('job1', search='engin')] == ['Ada']
+    assert [row['name'] for row in store.query('job1', search='first comp')] == ['Grace']
+    assert store.count('job1', search='london chief') == 1
+    assert store.count('job1', search='london admiral') == 0
+    # Search is scoped to the job
+    assert store.count('job2', search='engin') == 0
+
+
+def test_search_input_is_not_query_syntax(store):
+    assert store.count('job1', search='"Chief" OR NEAR(') == 0
+    assert store.count('job1', search='   ') == 3
+
+
+def test_pagination_and_streaming_agree(store):
+    paged = store.query('job1', limit=2) + store.query('job1', limit=2, offset=2)
+
+    assert paged == list(store.iter_rows('job1', batch_size=1))
+    assert 'id' not in paged[0]
+
+
+def test_fingerprint_changes_when_rows_are_added(store):
+    before = store.fingerprint('job1')
+    store.add('job1', profile('alan'))
+
+    assert store.fingerprint('job1') != before
+    assert store.named_count('job1') == 4
+    assert [job['job_id'] for job in store.recent_jobs()] == ['job1', 'job2']
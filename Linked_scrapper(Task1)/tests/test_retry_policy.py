@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from retry_policy import (PERMANENT, THROTTLED, TRANSIENT, RetryItem, RetryScheduler, classify_page,
+                          classify_status)
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    # uniform(0, x) -> x, so every backoff is its full delay
+    monkeypatch.setattr(random, 'uniform', lambda low, high: high)
+
+
+def failed_item(url, kind, attempt):
+    item = RetryItem(url, slot=0)
+    item.kind = kind
+    item.attempt = attempt
+    return item
+
+
+@pytest.mark.parametrize('url, title, text, expected', [
+    ('https://www.linkedin.com/checkpoint/challenge', '', '', 'throttled'),
+    ('https://www.linkedin.com/authwall?trk=x', '', '', 'throttled'),
+    ('https://www.linkedin.com/in/a/', 'Security Verification', '', 'throttled'),
+    ('https://www.linkedin.com/in/a/', '', 'Too many requests', 'throttled'),
+    ('https://www.linkedin.com/404/', '', '', 'not_found'),
+    ('https://www.linkedin.com/in/a/', 'Page not found', '', 'not_found'),
+    ('https://www.linkedin.com/in/a/', '', 'This profile is not available', 'restricted'),
+    ('https://www.linkedin.com/in/a/', 'Jane Doe | LinkedIn', 'Experience', None),
+    (None, None, None, None),
+])
+def test_classify_page(url, title, text, expected):
+    assert classify_page(url, title, text) == expected
+
+
+@pytest.mark.parametrize('status, expected', [
+    ('success', None),
+    ('not_found', PERMANENT),
+    ('restricted', PERMANENT),
+    ('throttled', THROTTLED),
+    ('error: timeout waiting for h1', TRANSIENT),
+    ('partial', TRANSIENT),
+])
+def test_classify_status(status, expected):
+    assert classify_status(status) == expected
+
+
+def test_backoff_doubles_up_to_the_cap(no_jitter):
+    retries = RetryScheduler(base_delay=30, max_delay=100, throttle_delay=600)
+
+    assert [retries.backoff(TRANSIENT, attempt) for attempt in (1, 2, 3, 4)] == [30, 60, 100, 100]
+    assert retries.backoff(THROTTLED, 1) == 100
+
+
+def test_backoff_jitter_keeps_at_least_half_the_delay():
+    retries = RetryScheduler(base_delay=30)
+
+    for _ in range(200):
+        assert 30 <= retries.backoff(TRANSIENT, 2) <= 60
+
+
+def test_deferred_item_is_due_after_its_backoff(clock, no_jitter):
+    retries = RetryScheduler(base_delay=30)
+    item = failed_item('a', TRANSIENT, attempt=1)
+
+    assert retries.defer(item)
+    assert retries.pop_due() is None
+    clock.now += 30
+    assert retries.pop_due() is item
+    assert len(retries) == 0
+    assert retries.deferred == 1
+
+
+def test_due_items_come_back_in_due_order(clock, no_jitter):
+    retries = RetryScheduler(base_delay=10)
+    later = failed_item('later', TRANSIENT, attempt=2)
+    sooner = failed_item('sooner', TRANSIENT, attempt=1)
+    retries.defer(later)
+    retries.defer(sooner)
+
+    clock.now += 20
+    assert [retries.pop_due().url, retries.pop_due().url] == ['sooner', 'later']
+
+
+def test_permanent_failures_are_not_retried(clock):
+    retries = RetryScheduler()
+
+    assert not retries.defer(failed_item('a', PERMANENT, attempt=1))
+    assert len(retries) == 0
+    assert retries.gave_up == 0
+
+
+def test_scheduler_gives_up_after_max_attempts(clock):
+    retries = RetryScheduler(max_attempts=3)
+
+    assert retries.defer(failed_item('a', TRANSIENT, attempt=2))
+    assert not retries.defer(failed_item('b', TRANSIENT, attempt=3))
+    assert retries.gave_up == 1
+
+
+def test_throttle_pauses_fresh_urls(clock, no_jitter):
+    retries = RetryScheduler(throttle_delay=600)
+    assert retries.cooldown_remaining() == 0
+
+    retries.defer(failed_item('a', THROTTLED, attempt=1))
+    assert retries.cooldown_remaining() == 600
+    clock.now += 600
+    assert retries.cooldown_remaining() == 0
+
+
+def test_drain_empties_the_queue_in_due_order(clock, no_jitter):
+    retries = RetryScheduler(base_delay=10)
+    retries.defer(failed_item('later', TRANSIENT, attempt=2))
+    retries.defer(failed_item('sooner', TRANSIENT, attempt=1))
+
+    assert [item.url for item in retries.drain()] == ['sooner', 'later']
+    assert len(retries) == 0
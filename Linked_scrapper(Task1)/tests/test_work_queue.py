@@ -0,0 +1,102 @@
+import pytest
+
+from work_queue import SQLiteWorkQueue, WorkQueue, open_work_queue
+
+URL_A = 'https://www.linkedin.com/in/alice/'
+URL_B = 'https://www.linkedin.com/in/bob/'
+
+
+@pytest.fixture
+def work_queue(tmp_path):
+    work_queue = SQLiteWorkQueue(str(tmp_path / 'queue.db'), max_attempts=2)
+    yield work_queue
+    work_queue.close()
+
+
+def test_work_queue_is_abstract():
+    with pytest.raises(TypeError):
+        WorkQueue()
+
+
+def test_enqueue_normalizes_and_skips_known_urls(work_queue):
+    assert work_queue.enqueue(['linkedin.com/in/Alice', URL_A, 'https://example.com/in/x']) == 1
+    assert work_queue.enqueue([URL_A, URL_B]) == 1
+    assert work_queue.counts() == {'queued': 2}
+
+
+def test_claimed_url_is_not_handed_out_twice(work_queue, clock):
+    work_queue.enqueue([URL_A])
+    assert work_queue.claim('w1', lease_seconds=60) == [URL_A]
+    assert work_queue.claim('w2', lease_seconds=60) == []
+
+
+def test_expired_lease_goes_back_to_the_queue(work_queue, clock):
+    work_queue.enqueue([URL_A])
+    work_queue.claim('w1', lease_seconds=60)
+
+    clock.now += 61
+    assert work_queue.claim('w2', lease_seconds=60) == [URL_A]
+    # The first worker lost its lease and can no longer finish the URL
+    assert not work_queue.complete('w1', URL_A, {'profile_url': URL_A})
+    assert work_queue.complete('w2', URL_A, {'profile_url': URL_A})
+    assert list(work_queue.iter_results()) == [{'profile_url': URL_A}]
+
+
+def test_heartbeat_keeps_the_lease(work_queue, clock):
+    work_queue.enqueue([URL_A])
+    work_queue.claim('w1', lease_seconds=60)
+
+    clock.now += 50
+    assert work_queue.heartbeat('w1', URL_A, 60)
+    clock.now += 50
+    assert work_queue.claim('w2', lease_seconds=60) == []
+
+
+def test_url_fails_once_every_attempt_expired(work_queue, clock):
+    work_queue.enqueue([URL_A])
+    for worker_id in ('w1', 'w2'):
+        assert work_queue.claim(worker_id, lease_seconds=60) == [URL_A]
+        clock.now += 61
+
+    assert work_queue.requeue_expired() == 1
+    assert work_queue.counts() == {'failed': 1}
+    assert work_queue.pending() == 0
+
+
+def test_deferred_url_comes_back_after_its_delay(work_queue, clock):
+    work_queue.enqueue([URL_A])
+    work_queue.claim('w1', lease_seconds=60)
+    assert work_queue.defer('w1', URL_A, delay=30)
+
+    clock.now += 29
+    assert work_queue.claim('w2', lease_seconds=60) == []
+    clock.now += 2
+    assert work_queue.claim('w2', lease_seconds=60) == [URL_A]
+    assert work_queue.attempts(URL_A) == 2
+
+
+def test_defer_refuses_once_attempts_are_used_up(work_queue, clock):
+    work_queue.enqueue([URL_A])
+    work_queue.claim('w1', lease_seconds=60)
+    work_queue.defer('w1', URL_A, delay=0)
+    clock.now += 1
+    work_queue.claim('w1', lease_seconds=60)
+
+    assert not work_queue.defer('w1', URL_A, delay=0)
+
+
+def test_release_does_not_count_the_attempt(work_queue, clock):
+    work_queue.enqueue([URL_A])
+    work_queue.claim('w1', lease_seconds=60)
+    work_queue.release('w1', URL_A)
+
+    assert work_queue.attempts(URL_A) == 0
+    assert work_queue.claim('w2', lease_seconds=60) == [URL_A]
+
+
+def test_open_work_queue_picks_the_backend(tmp_path):
+    work_queue = open_work_queue(f'sqlite://{tmp_path / "queue.db"}')
+    assert isinstance(work_queue, SQLiteWorkQueue)
+    work_queue.close()
+    with pytest.raises(ValueError):
+        open_work_queue('redis://localhost/0')
@@ -0,0 +1,282 @@
+import json
+import logging
+from abc import ABC, abstractmethod
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from profile_urls import normalize_profile_url
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    state TEXT NOT NULL DEFAULT 'queued',
+    worker_id TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_work_items_state ON work_items (state, lease_expires);
+"""
+
+
+def default_worker_id():
+    return f'{socket.gethostname()}-{os.getpid()}'
+
+
+class WorkQueue(ABC):
+    # Interface every work-queue backend implements. URLs move from queued to
+    # leased (claimed by one worker until lease_expires) to done; a lease that
+    # is not renewed by heartbeat() or finished by complete() in time goes back
+    # to queued, or to failed once max_attempts claims have all expired.
+
+    @abstractmethod
+    def enqueue(self, profile_urls):
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id, lease_seconds, limit=1):
+        pass
+
+    @abstractmethod
+    def heartbeat(self, worker_id, url, lease_seconds):
+        pass
+
+    @abstractmethod
+    def complete(self, worker_id, url, result):
+        pass
+
+    @abstractmethod
+    def defer(self, worker_id, url, delay):
+        pass
+
+    @abstractmethod
+    def release(self, worker_id, url):
+        pass
+
+    @abstractmethod
+    def attempts(self, url):
+        pass
+
+    @abstractmethod
+    def requeue_expired(self):
+        pass
+
+    @abstractmethod
+    def counts(self):
+        pass
+
+    @abstractmethod
+    def iter_results(self):
+        pass
+
+    def close(self):
+        pass
+
+    def pending(self):
+        counts = self.counts()
+        return counts.get('queued', 0) + counts.get('leased', 0)
+
+
+class SQLiteWorkQueue(WorkQueue):
+    # Default backend. Every node opens the same database file on a shared
+    # volume; claims run inside BEGIN IMMEDIATE so two workers can never
+    # lease the same URL. That guarantee rests on file locks, so the volume
+    # must support POSIX locking across hosts (e.g. NFSv4 with locking on,
+    # not SMB with oplocks). WAL is deliberately not used: its shared-memory
+    # index only works between processes on the same machine.
+
+    def __init__(self, path='work_queue.db', max_attempts=3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=DELETE')
+        self._conn.executescript(SCHEMA)
+
+    def _transaction(self, statements):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = statements(self._conn)
+                self._conn.execute('COMMIT')
+                return result
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def enqueue(self, profile_urls):
+        now = time.time()
+        rows = []
+        for url in profile_urls:
+            key = normalize_profile_url(url)
+            if key:
+                rows.append((key, now))
+
+        def insert(conn):
+            before = conn.total_changes
+            conn.executemany('INSERT OR IGNORE INTO work_items (url, updated_at) VALUES (?, ?)', rows)
+            return conn.total_changes - before
+
+        added = self._transaction(insert)
+        logging.info(f"Queued {added} new URLs ({len(rows) - added} already known)")
+        return added
+
+    def _requeue_expired(self, conn, now):
+        return conn.execute(
+            "UPDATE work_items SET"
+            " state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END,"
+            " worker_id = NULL, lease_expires = NULL, updated_at = ?"
+            " WHERE state = 'leased' AND lease_expires < ?",
+            (self.max_attempts, now, now)
+        ).rowcount
+
+    def claim(self, worker_id, lease_seconds, limit=1):
+        def take(conn):
+            now = time.time()
+            expired = self._requeue_expired(conn, now)
+            if expired:
+                logging.info(f"Re-queued {expired} URLs whose lease expired")
+
+            urls = [row[0] for row in conn.execute(
+                "SELECT url FROM work_items WHERE state = 'queued' ORDER BY id LIMIT ?",
+                (limit,)
+            )]
+            conn.executemany(
+                "UPDATE work_items SET state = 'leased', worker_id = ?, lease_expires = ?,"
+                " attempts = attempts + 1, updated_at = ? WHERE url = ?",
+                [(worker_id, now + lease_seconds, now, url) for url in urls]
+            )
+            return urls
+
+        return self._transaction(take)
+
+    def heartbeat(self, worker_id, url, lease_seconds):
+        now = time.time()
+        with self._lock:
+            renewed = self._conn.execute(
+                "UPDATE work_items SET lease_expires = ?, updated_at = ?"
+                " WHERE url = ? AND worker_id = ? AND state = 'leased'",
+                (now + lease_seconds, now, url, worker_id)
+            ).rowcount
+        return renewed == 1
+
+    def complete(self, worker_id, url, result):
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE work_items SET state = 'done', result = ?, worker_id = NULL,"
+                " lease_expires = NULL, updated_at = ?"
+                " WHERE url = ? AND worker_id = ? AND state = 'leased'",
+                (json.dumps(result), time.time(), url, worker_id)
+            ).rowcount
+        return updated == 1
+
+    def defer(self, worker_id, url, delay):
+        # Parks a failed URL, leased to nobody, until its backoff has passed;
+        # claim() then re-queues it like any expired lease. Returns False once
+        # the URL has used up its attempts.
+        now = time.time()
+        with self._lock:
+            deferred = self._conn.execute(
+                "UPDATE work_items SET worker_id = NULL, lease_expires = ?, updated_at = ?"
+                " WHERE url = ? AND worker_id = ? AND state = 'leased' AND attempts < ?",
+                (now + delay, now, url, worker_id, self.max_attempts)
+            ).rowcount
+        return deferred == 1
+
+    def attempts(self, url):
+        with self._lock:
+            row = self._conn.execute('SELECT attempts FROM work_items WHERE url = ?', (url,)).fetchone()
+        return row[0] if row else 0
+
+    def release(self, worker_id, url):
+        # Hands an unfinished URL back without counting the attempt
+        with self._lock:
+            self._conn.execute(
+                "UPDATE work_items SET state = 'queued', worker_id = NULL, lease_expires = NULL,"
+                " attempts = MAX(attempts - 1, 0), updated_at = ?"
+                " WHERE url = ? AND worker_id = ? AND state = 'leased'",
+                (time.time(), url, worker_id)
+            )
+
+    def requeue_expired(self):
+        return self._transaction(lambda conn: self._requeue_expired(conn, time.time()))
+
+    def counts(self):
+        with self._lock:
+            rows = self._conn.execute('SELECT state, COUNT(*) FROM work_items GROUP BY state').fetchall()
+        return dict(rows)
+
+    def iter_results(self):
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, result FROM work_items WHERE state = 'done' AND id > ? ORDER BY id LIMIT 500",
+                    (last_id,)
+                ).fetchall()
+            if not rows:
+                return
+            for row_id, result in rows:
+                yield json.loads(result)
+            last_id = rows[-1][0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+WORK_QUEUE_BACKENDS = {
+    'sqlite': SQLiteWorkQueue,
+}
+
+
+def open_work_queue(location, **options):
+    # "sqlite:///shared/queue.db", or a bare path for the SQLite default
+    scheme, separator, path = location.partition('://')
+    if not separator:
+        scheme, path = 'sqlite', location
+    if scheme not in WORK_QUEUE_BACKENDS:
+        raise ValueError(f"Unknown work queue backend: {scheme}")
+    return WORK_QUEUE_BACKENDS[scheme](path, **options)
+
+
+class LeaseHeartbeat:
+    # Renews a lease in the background while the URL is being scraped
+
+    def __init__(self, work_queue, worker_id, url, lease_seconds):
+        self.work_queue = work_queue
+        self.worker_id = worker_id
+        self.url = url
+        self.lease_seconds = lease_seconds
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f'{threading.current_thread().name}-heartbeat',
+            daemon=True
+        )
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                renewed = self.work_queue.heartbeat(self.worker_id, self.url, self.lease_seconds)
+            except Exception as e:
+                logging.warning(f"Heartbeat for {self.url} failed: {str(e)}")
+                continue
+            if not renewed:
+                logging.warning(f"Lost the lease on {self.url}")
+                self.lost = True
+                return